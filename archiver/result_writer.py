@@ -0,0 +1,109 @@
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import multiprocessing
+import queue
+import threading
+
+import numpy
+
+
+class ResultWriter:
+    """This class writes the results of a task in the background. During a run, the items appended to the series of
+    the task, e.g. its statistics, are handed over every batch_size records to a writer thread, which appends them
+    to .csv files in the project directory, so that partial results can be inspected while the run is in progress.
+    At the end, the stats and the archives are written by the same thread, and the plots are rendered by a forked
+    process once the thread is done, since forking a process while other threads are running is unsafe.
+    The thread is started on the first batch only, so that a task may fork its workers before that.
+    The first batch of a series replaces the .csv file of an earlier run in the same project, and the next ones are
+    appended to it. A task resumed from a checkpoint hands its whole series, as restored from the checkpoint, over to
+    its new writer on the first batch, so its .csv files are written again from the checkpoint, without the rows of
+    the stopped run which came after it."""
+
+    def __init__(self, project, batch_size=1000):
+        self.DIRECTORY = project.get_path()
+        self.NAME = project.get_name()
+        self.BATCH_SIZE = batch_size
+        self.NEXT_BATCH = batch_size
+
+        self.__series_lengths = {}
+        self.__series_files = set()
+        self.__queue = None
+        self.__writer = None
+        self.__error = None
+
+    def append(self, instance_counter, series):
+        """This function hands the items appended to the series since the last call over to the writer thread."""
+        series_deltas = []
+        for name, values in series.items():
+            length = self.__series_lengths.get(name, 0)
+            if len(values) > length:
+                delta = values[length:]
+                series_deltas.append((name, delta.copy() if isinstance(delta, numpy.ndarray) else delta))
+                self.__series_lengths[name] = len(values)
+        self.NEXT_BATCH = instance_counter + self.BATCH_SIZE
+        if len(series_deltas) != 0:
+            self.submit(self.__write_series, series_deltas)
+
+    def submit(self, function, *args):
+        """This function runs a function, e.g. the one which stores the stats of a task, on the writer thread."""
+        if self.__writer is None:
+            self.__queue = queue.Queue()
+            self.__writer = threading.Thread(target=self.__run)
+            self.__writer.start()
+        self.__queue.put((function, args))
+
+    def close(self):
+        """This function waits for the writer thread to be done."""
+        if self.__writer is not None:
+            self.__queue.put(None)
+            self.__writer.join()
+            self.__writer = None
+        if self.__error is not None:
+            error = self.__error
+            self.__error = None
+            raise error
+
+    def plot(self, function, *args):
+        """This function runs a function, e.g. the one which plots the results of a task, in a forked process once
+        the writer thread is done. The process is returned, and it is joined at exit if it is not joined before."""
+        self.close()
+        process = multiprocessing.get_context("fork").Process(target=function, args=args)
+        process.start()
+        return process
+
+    def __run(self):
+        while True:
+            task = self.__queue.get()
+            if task is None:
+                break
+            function, args = task
+            try:
+                function(*args)
+            except Exception as error:
+                # THE FIRST ERROR IS RAISED BY close() IN THE MAIN THREAD
+                if self.__error is None:
+                    self.__error = error
+
+    def __write_series(self, series_deltas):
+        for name, values in series_deltas:
+            file_path = self.DIRECTORY + (self.NAME + "_" + name).lower() + ".csv"
+            header = None
+            if isinstance(values, numpy.ndarray):
+                header = values.dtype.names
+                values = values.tolist()
+            is_new = file_path not in self.__series_files
+            self.__series_files.add(file_path)
+            series_writer = open(file_path, "w" if is_new else "a")
+            if is_new and header is not None:
+                series_writer.write(",".join(header) + "\n")
+            for value in values:
+                if isinstance(value, (list, tuple)):
+                    series_writer.write(",".join([str(v) for v in value]) + "\n")
+                else:
+                    series_writer.write(str(value) + "\n")
+            series_writer.close()
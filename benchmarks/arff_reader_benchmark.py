@@ -0,0 +1,48 @@
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import glob
+import time
+
+from streams.readers.arff_reader import ARFFReader
+
+
+class ARFFReaderBenchmark:
+    """This class compares the block-based ARFFReader.read() against the line-by-line reader
+    on the bundled data streams. Run it from the root of the framework:
+        python -m benchmarks.arff_reader_benchmark"""
+
+    @staticmethod
+    def time_reader(read_function, file_path, repeats):
+        timings = []
+        output = None
+        for _ in range(0, repeats):
+            t1 = time.perf_counter()
+            output = read_function(file_path)
+            t2 = time.perf_counter()
+            timings.append(t2 - t1)
+        return min(timings), output
+
+    @staticmethod
+    def run(file_paths, repeats=3):
+        print("%-40s %12s %12s %9s %6s" % ("Stream", "Line (s)", "Block (s)", "Speedup", "Same"))
+        for file_path in file_paths:
+            t_line, (labels_l, attributes_l, records_l) = \
+                ARFFReaderBenchmark.time_reader(ARFFReader.read_line_by_line, file_path, repeats)
+            t_block, (labels_b, attributes_b, records_b) = \
+                ARFFReaderBenchmark.time_reader(ARFFReader.read, file_path, repeats)
+            same = labels_l == labels_b and records_l == records_b and \
+                [[a.MINIMUM_VALUE, a.MAXIMUM_VALUE] for a in attributes_l] == \
+                [[a.MINIMUM_VALUE, a.MAXIMUM_VALUE] for a in attributes_b]
+            name = file_path.replace("\\", "/").split("/")[-1]
+            print("%-40s %12.3f %12.3f %8.2fx %6s" % (name, t_line, t_block, t_line / t_block, same))
+
+
+if __name__ == "__main__":
+    ARFFReaderBenchmark.run(sorted(glob.glob("data_streams/sine1_w_50_n_0.1/*.arff")) +
+                            sorted(glob.glob("data_streams/mixed_w_50_n_0.1/*.arff")) +
+                            sorted(glob.glob("data_streams/circles_w_500_n_0.1/*.arff")))
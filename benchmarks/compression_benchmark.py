@@ -0,0 +1,75 @@
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import bz2
+import glob
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import time
+
+from streams.readers.arff_reader import ARFFReader
+
+
+class CompressionBenchmark:
+    """This class measures the throughput loss of reading compressed copies of the bundled data streams,
+    relative to the uncompressed files, for both the block-based read() and the lazy iter_records().
+    Run it from the root of the framework:
+        python -m benchmarks.compression_benchmark"""
+
+    COMPRESSORS = {".gz": gzip.compress, ".bz2": bz2.compress, ".xz": lzma.compress}
+
+    @staticmethod
+    def time_function(function, repeats):
+        timings = []
+        for _ in range(0, repeats):
+            t1 = time.perf_counter()
+            function()
+            t2 = time.perf_counter()
+            timings.append(t2 - t1)
+        return min(timings)
+
+    @staticmethod
+    def consume_lazily(file_path):
+        for _ in ARFFReader.iter_records(file_path):
+            pass
+
+    @staticmethod
+    def run(file_paths, repeats=3):
+        tmp_dir = tempfile.mkdtemp()
+        print("%-32s %-6s %10s %12s %10s %12s %10s" %
+              ("Stream", "Format", "Size (KB)", "read() (s)", "Loss", "lazy (s)", "Loss"))
+        try:
+            for file_path in file_paths:
+                name = file_path.replace("\\", "/").split("/")[-1]
+                data = open(file_path, "rb").read()
+                t_read = CompressionBenchmark.time_function(lambda: ARFFReader.read(file_path), repeats)
+                t_lazy = CompressionBenchmark.time_function(lambda: CompressionBenchmark.consume_lazily(file_path),
+                                                            repeats)
+                print("%-32s %-6s %10.0f %12.3f %10s %12.3f %10s" %
+                      (name, "plain", len(data) / 1000, t_read, "-", t_lazy, "-"))
+                for extension, compress in CompressionBenchmark.COMPRESSORS.items():
+                    compressed_path = tmp_dir + "/" + name + extension
+                    writer = open(compressed_path, "wb")
+                    writer.write(compress(data))
+                    writer.close()
+                    tc_read = CompressionBenchmark.time_function(lambda: ARFFReader.read(compressed_path), repeats)
+                    tc_lazy = CompressionBenchmark.time_function(
+                        lambda: CompressionBenchmark.consume_lazily(compressed_path), repeats)
+                    print("%-32s %-6s %10.0f %12.3f %9.0f%% %12.3f %9.0f%%" %
+                          (name, extension, os.path.getsize(compressed_path) / 1000,
+                           tc_read, 100 * (tc_read / t_read - 1), tc_lazy, 100 * (tc_lazy / t_lazy - 1)))
+        finally:
+            shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    CompressionBenchmark.run(sorted(glob.glob("data_streams/sine1_w_50_n_0.1/*_101.arff")) +
+                             sorted(glob.glob("data_streams/mixed_w_50_n_0.1/*_101.arff")) +
+                             sorted(glob.glob("data_streams/circles_w_500_n_0.1/*_101.arff")))
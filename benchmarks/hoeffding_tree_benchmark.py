@@ -0,0 +1,161 @@
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+class HoeffdingTreeBenchmark:
+    """This class measures the training throughput of HoeffdingTree on the mixed stream and on a LED stream, i.e.
+    24 binary attributes and 10 classes, along with the number of splits and a hash of the grown tree, which covers
+    the split attributes and the number of examples seen by each node, so that two trees have the same hash only if
+    their splits were decided the same way at the same time. The tree is grown with the default settings, i.e. a split
+    is attempted on every example once a leaf has seen n_min examples, and with a grace period of 200.
+    Given the path of another checkout of the framework, e.g. a git worktree of an earlier commit, its tree is grown
+    on the same streams with its default settings, alternately, and the speedups are reported along with whether
+    the trees are the same. The default settings must make the same split decisions as the ones of the reference,
+    otherwise the benchmark exits with an error.
+    Run it from the root of the framework:
+        python -m benchmarks.hoeffding_tree_benchmark
+        git worktree add /tmp/tornado_reference HEAD~1
+        python -m benchmarks.hoeffding_tree_benchmark --reference /tmp/tornado_reference"""
+
+    MIXED_STREAM = "data_streams/mixed_w_50_n_0.1/mixed_w_50_n_0.1_101.arff"
+    GRACE_PERIODS = [None, 200]
+
+    @staticmethod
+    def get_signature(node):
+        signature = [node.get_attribute_name(), node.NUMBER_OF_EXAMPLES_SEEN]
+        for value, child in node.BRANCHES.items():
+            signature.append((value, HoeffdingTreeBenchmark.get_signature(child)))
+        return signature
+
+    @staticmethod
+    def count_splits(node):
+        return (1 if len(node.BRANCHES) != 0 else 0) + \
+            sum(HoeffdingTreeBenchmark.count_splits(child) for child in node.BRANCHES.values())
+
+    @staticmethod
+    def grow_tree(file_path, max_records, grace_period=None):
+        """This function trains a tree on the records, in this interpreter, against the framework found on its path,
+        and returns the records per second, the number of splits and the hash of the tree. A grace period of None
+        stands for the default settings of the tree."""
+
+        # THE MODULES ARE IMPORTED HERE, SO THAT THEY ARE THE ONES OF THE CHECKOUT GIVEN BY THE PATH
+        from classifier.hoeffding_tree import HoeffdingTree
+        from data_structures.attribute_scheme import AttributeScheme
+        from dictionary.tornado_dictionary import TornadoDic
+        from filters.attribute_handlers import TransformationPlan
+        from streams.readers.arff_reader import ARFFReader
+
+        labels, attributes, records = ARFFReader.read(file_path)
+        records = records[0:max_records]
+        attributes_scheme = AttributeScheme.get_scheme(attributes)
+        plan = TransformationPlan(labels, attributes, attributes_scheme, TornadoDic.NOM_CLASSIFIER)
+        records = [plan.transform(r) for r in records]
+
+        if grace_period is None:
+            tree = HoeffdingTree(labels, attributes_scheme['nominal'])
+        else:
+            tree = HoeffdingTree(labels, attributes_scheme['nominal'], grace_period=grace_period)
+        t1 = time.perf_counter()
+        for r in records:
+            tree.train(r)
+        t2 = time.perf_counter()
+
+        signature = repr(HoeffdingTreeBenchmark.get_signature(tree.get_root()))
+        return {"records_per_second": len(records) / (t2 - t1),
+                "splits": HoeffdingTreeBenchmark.count_splits(tree.get_root()),
+                "tree": hashlib.md5(signature.encode()).hexdigest()}
+
+    @staticmethod
+    def run_checkout(root, file_path, max_records, grace_period):
+        """This function grows the tree of the checkout of the framework at root, by a fresh interpreter."""
+        environment = dict(os.environ, PYTHONPATH=os.path.abspath(root))
+        arguments = [sys.executable, os.path.abspath(__file__), "--worker", os.path.abspath(file_path),
+                     "--max-records", str(max_records)]
+        if grace_period is not None:
+            arguments += ["--grace-period", str(grace_period)]
+        output = subprocess.run(arguments, env=environment, cwd=os.path.abspath(root), stdout=subprocess.PIPE,
+                                check=True)
+        return json.loads(output.stdout.decode().strip().split("\n")[-1])
+
+    @staticmethod
+    def run(max_records=20000, repeats=3, reference=None):
+        # THE WORKERS RUN THIS FILE AGAINST OTHER CHECKOUTS, SO THE LED GENERATOR IS ONLY IMPORTED HERE
+        from benchmarks.naive_bayes_benchmark import NaiveBayesBenchmark
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        runs = [("current", root, grace_period) for grace_period in HoeffdingTreeBenchmark.GRACE_PERIODS]
+        if reference is not None:
+            runs.append(("reference", reference, None))
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            led_path = tmp_dir + "/led.arff"
+            NaiveBayesBenchmark.generate_led(led_path, 5000)
+            streams = [("mixed", os.path.join(root, HoeffdingTreeBenchmark.MIXED_STREAM)), ("led", led_path)]
+            results = {}
+            for _ in range(0, repeats):
+                for stream_name, file_path in streams:
+                    for name, checkout_root, grace_period in runs:
+                        result = HoeffdingTreeBenchmark.run_checkout(checkout_root, file_path, max_records,
+                                                                     grace_period)
+                        best = results.setdefault((stream_name, name, grace_period), result)
+                        best["records_per_second"] = max(best["records_per_second"], result["records_per_second"])
+        finally:
+            shutil.rmtree(tmp_dir)
+
+        print("%-8s %-10s %-14s %12s %9s %8s %10s" %
+              ("Stream", "Checkout", "Grace period", "Records/s", "Speedup", "Splits", "Same tree"))
+        for stream_name, _ in streams:
+            reference_result = results.get((stream_name, "reference", None))
+            for name, _, grace_period in runs:
+                result = results[(stream_name, name, grace_period)]
+                speedup, same_tree = "-", "-"
+                if reference_result is not None:
+                    speedup = "%.2fx" % (result["records_per_second"] / reference_result["records_per_second"])
+                    same_tree = str(result["tree"] == reference_result["tree"])
+                print("%-8s %-10s %-14s %12.0f %9s %8d %10s" %
+                      (stream_name, name, "default" if grace_period is None else grace_period,
+                       result["records_per_second"], speedup, result["splits"], same_tree))
+        return results
+
+    @staticmethod
+    def have_same_split_decisions(results):
+        """This function returns whether the trees grown with the default settings, by this checkout and by the
+        reference, are the same on every stream."""
+        streams = set(stream_name for stream_name, _, _ in results.keys())
+        return all(results[(stream_name, "current", None)]["tree"] == results[(stream_name, "reference", None)]["tree"]
+                   for stream_name in streams)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Training throughput of HoeffdingTree.")
+    parser.add_argument("--max-records", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--reference", default=None, help="root of another checkout of the framework")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--grace-period", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        print(json.dumps(HoeffdingTreeBenchmark.grow_tree(args.worker, args.max_records, args.grace_period)))
+    else:
+        benchmark_results = HoeffdingTreeBenchmark.run(args.max_records, args.repeats, args.reference)
+        if args.reference is not None:
+            same_split_decisions = HoeffdingTreeBenchmark.have_same_split_decisions(benchmark_results)
+            print("The default settings make the same split decisions as the reference: " + str(same_split_decisions))
+            if same_split_decisions is False:
+                sys.exit(1)
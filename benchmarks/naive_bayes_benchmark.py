@@ -0,0 +1,122 @@
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+class NaiveBayesBenchmark:
+    """This class measures the throughput of NaiveBayes on a LED stream, i.e. 24 binary attributes and 10 classes,
+    tested then trained record by record, both on the records as they are read and on encoded records. A hash of
+    the predictions is reported with each rate. Given the path of another checkout of the framework, e.g. a git
+    worktree of an earlier commit, the learner of that checkout is run on the same stream, alternately, and the
+    speedups are reported along with whether the predictions are the same.
+    Run it from the root of the framework:
+        python -m benchmarks.naive_bayes_benchmark
+        git worktree add /tmp/tornado_reference HEAD~1
+        python -m benchmarks.naive_bayes_benchmark --reference /tmp/tornado_reference"""
+
+    MODES = ["plain", "encoded"]
+
+    @staticmethod
+    def generate_led(file_path, concept_length):
+        from streams.generators.led_stream import LEDConceptDrift
+        with contextlib.redirect_stdout(open(os.devnull, "w")):
+            LEDConceptDrift(concept_length=concept_length, num_irr_attr=17).generate(file_path[:-len(".arff")])
+
+    @staticmethod
+    def run_learner(file_path):
+        """This function runs the learner in each mode once, in this interpreter, against the framework found on its
+        path, and returns the records per second and the hash of the predictions of each mode."""
+
+        # THE MODULES ARE IMPORTED HERE, SO THAT THEY ARE THE ONES OF THE CHECKOUT GIVEN BY THE PATH
+        from classifier.naive_bayes import NaiveBayes
+        from data_structures.attribute_scheme import AttributeScheme
+        from data_structures.encoded_record import RecordEncoder
+        from streams.readers.arff_reader import ARFFReader
+
+        labels, attributes, records = ARFFReader.read(file_path)
+        attributes_scheme = AttributeScheme.get_scheme(attributes)
+        encoder = RecordEncoder(labels, attributes_scheme['nominal'])
+
+        results = {}
+        for mode in NaiveBayesBenchmark.MODES:
+            learner = NaiveBayes(labels, attributes_scheme['nominal'])
+            mode_records = [encoder.encode(r) for r in records] if mode == "encoded" else records
+            predictions = []
+            t1 = time.perf_counter()
+            for r in mode_records:
+                if learner.is_ready():
+                    predictions.append(learner.test(r))
+                learner.train(r)
+                learner.set_ready()
+            t2 = time.perf_counter()
+            # THE PREDICTIONS OF ENCODED RECORDS ARE CODES, WHICH ARE DECODED TO BE COMPARED
+            predictions = [labels[p] if isinstance(p, int) else p for p in predictions]
+            results[mode] = {"records_per_second": len(mode_records) / (t2 - t1),
+                             "predictions": hashlib.md5(repr(predictions).encode()).hexdigest()}
+        return results
+
+    @staticmethod
+    def run_checkout(root, file_path):
+        """This function runs the learner of the checkout of the framework at root, by a fresh interpreter."""
+        environment = dict(os.environ, PYTHONPATH=os.path.abspath(root))
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", os.path.abspath(file_path)],
+                                env=environment, cwd=os.path.abspath(root), stdout=subprocess.PIPE, check=True)
+        return json.loads(output.stdout.decode().strip().split("\n")[-1])
+
+    @staticmethod
+    def run(concept_length=5000, repeats=3, reference=None):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        checkouts = [("current", root)] + ([("reference", reference)] if reference is not None else [])
+        best_rates = {name: {mode: 0 for mode in NaiveBayesBenchmark.MODES} for name, _ in checkouts}
+        hashes = {name: {} for name, _ in checkouts}
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            file_path = tmp_dir + "/led.arff"
+            NaiveBayesBenchmark.generate_led(file_path, concept_length)
+            for _ in range(0, repeats):
+                for name, checkout_root in checkouts:
+                    for mode, result in NaiveBayesBenchmark.run_checkout(checkout_root, file_path).items():
+                        best_rates[name][mode] = max(best_rates[name][mode], result["records_per_second"])
+                        hashes[name][mode] = result["predictions"]
+        finally:
+            shutil.rmtree(tmp_dir)
+
+        print("%-10s %12s %12s %9s %16s" % ("Records", "Records/s", "Reference", "Speedup", "Same predictions"))
+        for mode in NaiveBayesBenchmark.MODES:
+            rate = best_rates["current"][mode]
+            if reference is None:
+                print("%-10s %12.0f %12s %9s %16s" % (mode, rate, "-", "-", "-"))
+            else:
+                reference_rate = best_rates["reference"][mode]
+                print("%-10s %12.0f %12.0f %8.2fx %16s" % (mode, rate, reference_rate, rate / reference_rate,
+                                                          hashes["current"][mode] == hashes["reference"][mode]))
+        return best_rates
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of NaiveBayes on a LED stream.")
+    parser.add_argument("--concept-length", type=int, default=5000, help="the stream has four concepts")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--reference", default=None, help="root of another checkout of the framework")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        print(json.dumps(NaiveBayesBenchmark.run_learner(args.worker)))
+    else:
+        NaiveBayesBenchmark.run(args.concept_length, args.repeats, args.reference)
@@ -0,0 +1,142 @@
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+
+
+class PipelineBenchmark:
+    """This class measures the throughput of the prequential tasks, i.e. Prequential, PrequentialDrift,
+    PrequentialDriftEvaluator and PrequentialMultiPairs, as the records per second of their loops over a stream,
+    which are reported by their last progress event. Each task is run by a fresh interpreter, repeats times, and its
+    best rate is kept. Given the path of another checkout of the framework, e.g. a git worktree of an earlier commit,
+    the same tasks are also run against it, alternately, and the speedups are reported.
+    Run it from the root of the framework:
+        python -m benchmarks.pipeline_benchmark
+        git worktree add /tmp/tornado_reference HEAD~1
+        python -m benchmarks.pipeline_benchmark --reference /tmp/tornado_reference"""
+
+    TASKS = ["Prequential", "PrequentialDrift", "PrequentialDriftEvaluator", "PrequentialMultiPairs"]
+
+    @staticmethod
+    def run_tasks(file_path, max_records, project_folder, suffix=""):
+        """This function runs each task once, in this interpreter, against the framework found on its path, and
+        returns the records per second of each task."""
+
+        # THE MODULES ARE IMPORTED HERE, SO THAT THEY ARE THE ONES OF THE CHECKOUT GIVEN BY THE PATH
+        from classifier.__init__ import NaiveBayes, Perceptron, HoeffdingTree
+        from data_structures.attribute_scheme import AttributeScheme
+        from drift_detection.__init__ import FHDDM, DDM, ADWINChangeDetector, CUSUM, PH
+        from filters.project_creator import Project
+        from streams.readers.arff_reader import ARFFReader
+        from tasks.__init__ import Prequential, PrequentialDrift, PrequentialDriftEvaluator, PrequentialMultiPairs
+        from tasks.events import TaskListener
+
+        class RateListener(TaskListener):
+
+            def __init__(self):
+                self.RECORDS_PER_SECOND = 0
+
+            def on_progress(self, instance_counter, stream_length, records_per_second, eta):
+                self.RECORDS_PER_SECOND = records_per_second
+
+        labels, attributes, records = ARFFReader.read(file_path)
+        records = records[0:max_records]
+        attributes_scheme = AttributeScheme.get_scheme(attributes)
+        actual_drift_points = [len(records) * i // 5 for i in range(1, 5)]
+
+        rates = {}
+        for task_name in PipelineBenchmark.TASKS:
+            random.seed(1)
+            listener = RateListener()
+            with contextlib.redirect_stdout(open(os.devnull, "w")):
+                project = Project(project_folder, task_name.lower() + suffix)
+                if task_name == "Prequential":
+                    task = Prequential(NaiveBayes(labels, attributes_scheme['nominal']), attributes, attributes_scheme,
+                                       project, listeners=[listener])
+                elif task_name == "PrequentialDrift":
+                    task = PrequentialDrift(NaiveBayes(labels, attributes_scheme['nominal']), FHDDM(), attributes,
+                                            attributes_scheme, project, listeners=[listener])
+                elif task_name == "PrequentialDriftEvaluator":
+                    task = PrequentialDriftEvaluator(HoeffdingTree(labels, attributes_scheme['nominal']), DDM(),
+                                                     attributes, attributes_scheme, actual_drift_points, 250,
+                                                     project, listeners=[listener])
+                else:
+                    pairs = [[learner_class(labels, attributes_scheme[scheme]), detector_class()]
+                             for learner_class, scheme in [(NaiveBayes, 'nominal'), (Perceptron, 'numeric'),
+                                                           (HoeffdingTree, 'nominal')]
+                             for detector_class in [FHDDM, DDM, ADWINChangeDetector, CUSUM, PH]]
+                    task = PrequentialMultiPairs(pairs, attributes, attributes_scheme, actual_drift_points, 250,
+                                                 [1, 1, 1, 1, 1, 1], project, ["#000000"] * len(pairs),
+                                                 listeners=[listener])
+                task.run(records, 1)
+                # THE PLOTS ARE RENDERED BY FORKED PROCESSES, WHICH ARE WAITED FOR BEFORE THE NEXT TASK IS RUN
+                for process in multiprocessing.active_children():
+                    process.join()
+            rates[task_name] = listener.RECORDS_PER_SECOND
+        return rates
+
+    @staticmethod
+    def run_checkout(root, file_path, max_records, project_folder, suffix):
+        """This function runs the tasks against the checkout of the framework at root, by a fresh interpreter."""
+        environment = dict(os.environ, PYTHONPATH=os.path.abspath(root))
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", os.path.abspath(file_path),
+                                 "--max-records", str(max_records), "--projects", project_folder, "--suffix", suffix],
+                                env=environment, cwd=os.path.abspath(root), stdout=subprocess.PIPE, check=True)
+        return json.loads(output.stdout.decode().strip().split("\n")[-1])
+
+    @staticmethod
+    def run(file_path, max_records=20000, repeats=3, reference=None):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        checkouts = [("current", root)] + ([("reference", reference)] if reference is not None else [])
+        best_rates = {name: {task_name: 0 for task_name in PipelineBenchmark.TASKS} for name, _ in checkouts}
+
+        project_folder = tempfile.mkdtemp()
+        try:
+            for repeat in range(0, repeats):
+                for name, checkout_root in checkouts:
+                    rates = PipelineBenchmark.run_checkout(checkout_root, file_path, max_records, project_folder,
+                                                           "_" + name + "_" + str(repeat))
+                    for task_name, rate in rates.items():
+                        best_rates[name][task_name] = max(best_rates[name][task_name], rate)
+        finally:
+            shutil.rmtree(project_folder)
+
+        print("%-28s %14s %14s %9s" % ("Task", "Records/s", "Reference", "Speedup"))
+        for task_name in PipelineBenchmark.TASKS:
+            rate = best_rates["current"][task_name]
+            if reference is None:
+                print("%-28s %14.0f %14s %9s" % (task_name, rate, "-", "-"))
+            else:
+                reference_rate = best_rates["reference"][task_name]
+                print("%-28s %14.0f %14.0f %8.2fx" % (task_name, rate, reference_rate, rate / reference_rate))
+        return best_rates
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of the prequential tasks.")
+    parser.add_argument("stream", nargs="?", default="data_streams/mixed_w_50_n_0.1/mixed_w_50_n_0.1_101.arff")
+    parser.add_argument("--max-records", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--reference", default=None, help="root of another checkout of the framework")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--projects", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--suffix", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is True:
+        print(json.dumps(PipelineBenchmark.run_tasks(args.stream, args.max_records, args.projects, args.suffix)))
+    else:
+        PipelineBenchmark.run(args.stream, args.max_records, args.repeats, args.reference)
@@ -0,0 +1,306 @@
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import argparse
+import glob
+import importlib
+import json
+import multiprocessing
+import os
+import pkgutil
+import platform
+import random
+import resource
+import sys
+import time
+
+import numpy
+
+import classifier
+import drift_detection
+from classifier.classifier import SuperClassifier
+from data_structures.attribute import Attribute
+from data_structures.attribute_scheme import AttributeScheme
+from dictionary.tornado_dictionary import TornadoDic
+from drift_detection.detector import SuperDetector
+from filters.attribute_handlers import TransformationPlan
+from streams.readers.arff_reader import ARFFReader
+
+
+class ThroughputBenchmark:
+    """This class runs every learner, i.e. every subclass of SuperClassifier, with every drift detector, i.e. every
+    subclass of SuperDetector, against the bundled data streams and synthetic streams, as PrequentialDrift does.
+    For each combination, it measures the records per second of the whole loop, the p50 and p99 latencies of
+    do_testing(), do_training() and detect() per record, in microseconds, and the peak RSS of the process.
+    Each combination is run by a forked process, so that its peak RSS is its own. The results are written in JSON,
+    and they can be compared against a baseline file, where the regressions beyond a threshold are flagged.
+    Run it from the root of the framework:
+        python -m benchmarks.throughput_benchmark --output results.json
+        python -m benchmarks.throughput_benchmark --output new.json --compare results.json"""
+
+    DATA_STREAMS = {"sine1": "data_streams/sine1_w_50_n_0.1/*_101.arff",
+                    "mixed": "data_streams/mixed_w_50_n_0.1/*_101.arff",
+                    "circles": "data_streams/circles_w_500_n_0.1/*_101.arff"}
+
+    OPERATIONS = ["do_testing", "do_training", "detect"]
+
+    @staticmethod
+    def get_subclasses(package, super_class):
+        """This function imports every module of a package, and returns the subclasses of a super class by name."""
+        for module in pkgutil.iter_modules(package.__path__):
+            importlib.import_module(package.__name__ + "." + module.name)
+        subclasses = {}
+        stack = list(super_class.__subclasses__())
+        while len(stack) != 0:
+            subclass = stack.pop()
+            subclasses[subclass.__name__] = subclass
+            stack += subclass.__subclasses__()
+        return dict(sorted(subclasses.items()))
+
+    @staticmethod
+    def generate_synthetic_stream(length, width, num_drifts=4, noise_rate=0.1, random_seed=1):
+        """This function generates a stream of width numeric attributes in [0, 1], whose class is given by a random
+        hyperplane. The classes are swapped at every one of num_drifts evenly spaced concept drifts."""
+        generator = numpy.random.RandomState(random_seed)
+        weights = generator.uniform(0, 1, width)
+        values = numpy.round(generator.uniform(0, 1, (length, width)), 5)
+        classes = values.dot(weights) > weights.sum() / 2
+        concepts = (numpy.arange(length) * (num_drifts + 1) // length) % 2 == 1
+        noise = generator.uniform(0, 1, length) < noise_rate
+        classes = classes ^ concepts ^ noise
+
+        attributes = []
+        for i in range(0, width):
+            attribute = Attribute()
+            attribute.set_name("a" + str(i))
+            attribute.set_type(TornadoDic.NUMERIC_ATTRIBUTE)
+            attribute.set_possible_values([])
+            attribute.set_bounds_values(float(values[:, i].min()), float(values[:, i].max()))
+            attributes.append(attribute)
+
+        labels = ['p', 'n']
+        records = [row + [labels[0] if c else labels[1]] for row, c in zip(values.tolist(), classes.tolist())]
+        return labels, attributes, records
+
+    @staticmethod
+    def run_combination(learner_class, detector_class, labels, attributes, records, random_seed=1):
+        """This function runs one learner with one drift detector against the records, and returns its stats."""
+
+        random.seed(random_seed)
+        attributes_scheme = AttributeScheme.get_scheme(attributes)
+        if learner_class.LEARNER_CATEGORY == TornadoDic.NOM_CLASSIFIER:
+            learner = learner_class(labels, attributes_scheme['nominal'])
+        else:
+            learner = learner_class(labels, attributes_scheme['numeric'])
+        detector = detector_class()
+        transformation_plan = TransformationPlan(learner.CLASSES, attributes, attributes_scheme,
+                                                 learner.LEARNER_CATEGORY, learner.ENCODED_RECORDS)
+        trainable = learner.LEARNER_TYPE == TornadoDic.TRAINABLE
+
+        latencies = {operation: [] for operation in ThroughputBenchmark.OPERATIONS}
+        testing_latencies = latencies["do_testing"]
+        training_latencies = latencies["do_training"]
+        detection_latencies = latencies["detect"]
+        clock = time.perf_counter
+        num_drifts = 0
+
+        t_start = clock()
+        for record in records:
+
+            if record.__contains__("?"):
+                continue
+
+            r = transformation_plan.transform(record)
+
+            if learner.is_ready():
+                t1 = clock()
+                predicted_class = learner.do_testing(r)
+                t2 = clock()
+                testing_latencies.append(t2 - t1)
+
+                t1 = clock()
+                warning_status, drift_status = detector.detect(r[len(r) - 1] == predicted_class)
+                t2 = clock()
+                detection_latencies.append(t2 - t1)
+
+                if drift_status:
+                    num_drifts += 1
+                    learner.reset()
+                    detector.reset()
+                    continue
+
+                t1 = clock()
+                learner.do_training(r) if trainable else learner.do_loading(r)
+                t2 = clock()
+                training_latencies.append(t2 - t1)
+            else:
+                t1 = clock()
+                learner.do_training(r) if trainable else learner.do_loading(r)
+                t2 = clock()
+                training_latencies.append(t2 - t1)
+                learner.set_ready()
+                learner.update_confusion_matrix(r[len(r) - 1], r[len(r) - 1])
+        t_end = clock()
+
+        stats = {"records": len(records),
+                 "records_per_second": round(len(records) / (t_end - t_start), 1) if t_end > t_start else 0,
+                 "num_drifts": num_drifts,
+                 # ON LINUX, ru_maxrss IS GIVEN IN KILOBYTES, WHILE IT IS GIVEN IN BYTES ON MACOS
+                 "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss //
+                                (1024 if sys.platform == "darwin" else 1)}
+        for operation, timings in latencies.items():
+            if len(timings) == 0:
+                stats[operation] = {"calls": 0, "p50_us": None, "p99_us": None}
+                continue
+            p50, p99 = numpy.percentile(numpy.array(timings) * 1e6, [50, 99])
+            stats[operation] = {"calls": len(timings), "p50_us": round(float(p50), 3), "p99_us": round(float(p99), 3)}
+        return stats
+
+    @staticmethod
+    def run_forked(learner_class, detector_class, labels, attributes, records):
+        """This function runs a combination in a forked process, which shares the records with this one."""
+        context = multiprocessing.get_context("fork")
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=ThroughputBenchmark.__run_worker,
+                                  args=(learner_class, detector_class, labels, attributes, records, sender))
+        process.start()
+        sender.close()
+        try:
+            stats = receiver.recv()
+        except EOFError:
+            stats = {"error": "THE PROCESS HAS STOPPED WITH EXIT CODE " + str(process.exitcode)}
+        receiver.close()
+        process.join()
+        return stats
+
+    @staticmethod
+    def __run_worker(learner_class, detector_class, labels, attributes, records, connection):
+        try:
+            stats = ThroughputBenchmark.run_combination(learner_class, detector_class, labels, attributes, records)
+        except Exception as error:
+            stats = {"error": type(error).__name__ + ": " + str(error)}
+        connection.send(stats)
+        connection.close()
+
+    @staticmethod
+    def load_streams(stream_names, synthetic_shapes, max_records=None):
+        """This function returns (name, labels, attributes, records) of the bundled streams, given by their names,
+        and of the synthetic streams, given as (length, width) pairs."""
+        streams = []
+        for name in stream_names:
+            for file_path in sorted(glob.glob(ThroughputBenchmark.DATA_STREAMS[name])):
+                labels, attributes, records = ARFFReader.read(file_path)
+                stream_name = os.path.basename(file_path).split(".arff")[0]
+                streams.append((stream_name, labels, attributes, records[0:max_records]))
+        for length, width in synthetic_shapes:
+            labels, attributes, records = ThroughputBenchmark.generate_synthetic_stream(length, width)
+            streams.append(("synthetic_" + str(length) + "x" + str(width), labels, attributes, records))
+        return streams
+
+    @staticmethod
+    def run(streams, learner_names=None, detector_names=None, output_path=None):
+        learners = ThroughputBenchmark.get_subclasses(classifier, SuperClassifier)
+        detectors = ThroughputBenchmark.get_subclasses(drift_detection, SuperDetector)
+        if learner_names is not None:
+            learners = {name: learners[name] for name in learner_names}
+        if detector_names is not None:
+            detectors = {name: detectors[name] for name in detector_names}
+
+        results = []
+        print("%-28s %-14s %-24s %10s %10s %10s %10s %10s %10s" %
+              ("Stream", "Learner", "Detector", "Records/s", "Test p50", "Test p99",
+               "Train p50", "Detect p50", "RSS (MB)"))
+        for stream_name, labels, attributes, records in streams:
+            for learner_name, learner_class in learners.items():
+                for detector_name, detector_class in detectors.items():
+                    stats = ThroughputBenchmark.run_forked(learner_class, detector_class, labels, attributes, records)
+                    result = {"stream": stream_name, "learner": learner_name, "detector": detector_name}
+                    result.update(stats)
+                    results.append(result)
+                    if "error" in stats:
+                        print("%-28s %-14s %-24s %s" % (stream_name, learner_name, detector_name, stats["error"]))
+                        continue
+                    print("%-28s %-14s %-24s %10.0f %10s %10s %10s %10s %10.1f" %
+                          (stream_name, learner_name, detector_name, stats["records_per_second"],
+                           stats["do_testing"]["p50_us"], stats["do_testing"]["p99_us"],
+                           stats["do_training"]["p50_us"], stats["detect"]["p50_us"], stats["peak_rss_kb"] / 1024))
+
+        report = {"environment": {"python": platform.python_version(), "numpy": numpy.__version__,
+                                  "platform": platform.platform(), "processor": platform.processor(),
+                                  "time": time.strftime("%Y-%m-%d %H:%M:%S")},
+                  "results": results}
+        if output_path is not None:
+            writer = open(output_path, "w")
+            json.dump(report, writer, indent=2)
+            writer.close()
+        return report
+
+    @staticmethod
+    def compare(report, baseline, threshold=0.2):
+        """This function returns the regressions of a report against a baseline, i.e. the combinations whose records
+        per second are lower, or whose latencies or peak RSS are higher, than the ones of the baseline by more than
+        the threshold, given as a fraction."""
+        baseline_results = {(r["stream"], r["learner"], r["detector"]): r for r in baseline["results"]}
+        regressions = []
+        for result in report["results"]:
+            key = (result["stream"], result["learner"], result["detector"])
+            base = baseline_results.get(key)
+            if base is None or "error" in base:
+                continue
+            if "error" in result:
+                regressions.append((key, "error", base["records_per_second"], result["error"]))
+                continue
+            if result["records_per_second"] < base["records_per_second"] * (1 - threshold):
+                regressions.append((key, "records_per_second", base["records_per_second"],
+                                    result["records_per_second"]))
+            for operation in ThroughputBenchmark.OPERATIONS:
+                for percentile in ["p50_us", "p99_us"]:
+                    old, new = base[operation][percentile], result[operation][percentile]
+                    if old is not None and new is not None and new > old * (1 + threshold):
+                        regressions.append((key, operation + "." + percentile, old, new))
+            if result["peak_rss_kb"] > base["peak_rss_kb"] * (1 + threshold):
+                regressions.append((key, "peak_rss_kb", base["peak_rss_kb"], result["peak_rss_kb"]))
+        return regressions
+
+    @staticmethod
+    def print_regressions(regressions, threshold):
+        if len(regressions) == 0:
+            print("No regression beyond " + "%0.0f" % (100 * threshold) + "% is found.")
+            return
+        print(str(len(regressions)) + " regressions beyond " + "%0.0f" % (100 * threshold) + "% are found:")
+        for (stream_name, learner_name, detector_name), metric, old, new in regressions:
+            print("%-28s %-14s %-24s %-22s %12s -> %s" % (stream_name, learner_name, detector_name, metric, old, new))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of every learner with every drift detector.")
+    parser.add_argument("--streams", nargs="*", default=list(ThroughputBenchmark.DATA_STREAMS.keys()),
+                        choices=list(ThroughputBenchmark.DATA_STREAMS.keys()), help="bundled streams to run")
+    parser.add_argument("--max-records", type=int, default=20000, help="records taken from each bundled stream, all if 0")
+    parser.add_argument("--synthetic", nargs="*", default=["20000x10"],
+                        help="synthetic streams, given as LENGTHxWIDTH, e.g. 20000x10")
+    parser.add_argument("--learners", nargs="*", default=None, help="learner class names, all by default")
+    parser.add_argument("--detectors", nargs="*", default=None, help="detector class names, all by default")
+    parser.add_argument("--output", default=None, help="JSON file the results are written to")
+    parser.add_argument("--compare", default=None, help="baseline JSON file the results are compared against")
+    parser.add_argument("--report", default=None, help="JSON file compared against the baseline, without a run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="tolerated slowdown, as a fraction")
+    args = parser.parse_args()
+
+    if args.report is not None:
+        if args.compare is None:
+            parser.error("--report needs a baseline given by --compare")
+        benchmark_report = json.load(open(args.report))
+    else:
+        shapes = [tuple(int(n) for n in shape.lower().split("x")) for shape in args.synthetic]
+        benchmark_streams = ThroughputBenchmark.load_streams(args.streams, shapes, args.max_records or None)
+        benchmark_report = ThroughputBenchmark.run(benchmark_streams, args.learners, args.detectors, args.output)
+
+    if args.compare is not None:
+        found_regressions = ThroughputBenchmark.compare(benchmark_report, json.load(open(args.compare)), args.threshold)
+        ThroughputBenchmark.print_regressions(found_regressions, args.threshold)
+        sys.exit(1 if len(found_regressions) != 0 else 0)
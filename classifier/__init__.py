@@ -1,5 +1,5 @@
-from classifier.decision_stump import DecisionStump
-from classifier.hoeffding_tree import HoeffdingTree
-from classifier.naive_bayes import NaiveBayes
-from classifier.perceptron import Perceptron
-from classifier.knn import KNN
+from classifier.decision_stump import DecisionStump
+from classifier.hoeffding_tree import HoeffdingTree
+from classifier.naive_bayes import NaiveBayes
+from classifier.perceptron import Perceptron
+from classifier.knn import KNN
@@ -1,144 +1,186 @@
-"""
-The Tornado Framework
-By Ali Pesaranghader
-University of Ottawa, Ontario, Canada
-E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
-"""
-
-import time
-from collections import OrderedDict
-
-from dictionary.tornado_dictionary import TornadoDic
-from evaluators.classifier_evaluator import PredictionEvaluator
-
-
-class SuperClassifier:
-    """A classifier, e.g. Naive Bayes, inherits this super class!"""
-
-    def __init__(self, labels, attributes):
-        self.CLASSES = labels
-        self.ATTRIBUTES = attributes
-        self.__CONFUSION_MATRIX = OrderedDict()
-        self.__GLOBAL_CONFUSION_MATRIX = OrderedDict()
-
-        self.NUMBER_OF_INSTANCES_OBSERVED = 0
-
-        self._TRAINING_TIME = 0
-        self._TESTING_TIME = 0
-        self._TOTAL_TRAINING_TIME = 0
-        self._TOTAL_TESTING_TIME = 0
-
-        # THE _ACTIVE ATTRIBUTE IS USED TO SHOW WHETHER A CLASSIFIER IS SUSPENDED OR NOT
-        self._ACTIVE = True
-        self._IS_READY = False
-
-        self.__init_confusion_matrix()
-        self.__init_global_confusion_matrix()
-
-    def __init_confusion_matrix(self):
-        # self.__CONFUSION_MATRIX =
-        for real_class in self.CLASSES:
-            self.__CONFUSION_MATRIX[real_class] = OrderedDict()
-            for predicted_class in self.CLASSES:
-                self.__CONFUSION_MATRIX[real_class][predicted_class] = 0
-
-    def __init_global_confusion_matrix(self):
-        # self.__GLOBAL_CONFUSION_MATRIX =
-        for real_class in self.CLASSES:
-            self.__GLOBAL_CONFUSION_MATRIX[real_class] = OrderedDict()
-            for predicted_class in self.CLASSES:
-                self.__GLOBAL_CONFUSION_MATRIX[real_class][predicted_class] = 0
-
-    def update_confusion_matrix(self, real_class, predicted_class):
-        self.__CONFUSION_MATRIX[real_class][predicted_class] += 1
-        self.__GLOBAL_CONFUSION_MATRIX[real_class][predicted_class] += 1
-
-    def get_confusion_matrix(self):
-        return self.__CONFUSION_MATRIX
-
-    def print_confusion_matrix(self):
-        for real_class in self.CLASSES:
-            for predicted_class in self.CLASSES:
-                print(self.__CONFUSION_MATRIX[real_class][predicted_class], end="\t")
-            print()
-
-    def get_global_confusion_matrix(self):
-        return self.__GLOBAL_CONFUSION_MATRIX
-
-    def reset_confusion_matrix(self):
-        self.__init_confusion_matrix()
-
-    def is_ready(self):
-        return self._IS_READY
-
-    def set_ready(self):
-        self._IS_READY = True
-
-    def is_active(self):
-        return self._ACTIVE
-
-    def deactivate(self):
-        self._ACTIVE = False
-
-    def activate(self):
-        self._ACTIVE = True
-
-    def get_training_time(self):
-        return self._TRAINING_TIME
-
-    def get_testing_time(self):
-        return self._TESTING_TIME
-
-    def get_running_time(self):
-        return self._TRAINING_TIME + self._TESTING_TIME
-
-    def get_total_running_time(self):
-        return self._TOTAL_TRAINING_TIME + self._TOTAL_TESTING_TIME
-
-    def get_error(self):
-        return PredictionEvaluator.calculate(TornadoDic.ERROR_RATE, self.get_confusion_matrix())
-
-    def _reset_stats(self):
-        # HERE I NEED TO MAKE SOME MODIFICATIONS
-        # FOR CONSIDERING CONCEPT DRIFTS.
-        self.NUMBER_OF_INSTANCES_OBSERVED = 0
-        self._TRAINING_TIME = 0
-        self._TESTING_TIME = 0
-        self._IS_READY = False
-        self._ACTIVE = True
-
-        self.reset_confusion_matrix()
-
-    def do_training(self, record):
-        t1 = time.perf_counter()
-        self.train(record)
-        t2 = time.perf_counter()
-        delta = (t2 - t1) * 1000  # in milliseconds
-        self._TRAINING_TIME += delta
-        self._TOTAL_TRAINING_TIME += delta
-
-    def train(self, record):
-        pass
-
-    def do_loading(self, record):
-        t1 = time.time()
-        self.load(record)
-        t2 = time.time()
-        delta = (t2 - t1) * 1000  # in milliseconds
-        self._TRAINING_TIME += delta
-        self._TOTAL_TRAINING_TIME += delta
-
-    def load(self, record):
-        pass
-
-    def do_testing(self, record):
-        t1 = time.time()
-        pr = self.test(record)
-        t2 = time.time()
-        delta = (t2 - t1) * 1000  # in milliseconds
-        self._TESTING_TIME += delta
-        self._TOTAL_TESTING_TIME += delta
-        return pr
-
-    def test(self, record):
-        pass
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import time
+from collections import OrderedDict
+
+import numpy
+
+from dictionary.tornado_dictionary import TornadoDic
+from evaluators.classifier_evaluator import PredictionEvaluator
+from evaluators.memory_estimator import MemoryEstimator
+
+
+class SuperClassifier:
+    """A classifier, e.g. Naive Bayes, inherits this super class!"""
+
+    # A CLASSIFIER WHICH TAKES ENCODED RECORDS, I.E. CODES INSTEAD OF NOMINAL VALUES AND LABELS, SETS IT TO TRUE
+    ENCODED_RECORDS = False
+
+    def __init__(self, labels, attributes):
+        self.CLASSES = labels
+        self.ATTRIBUTES = attributes
+        self.__CONFUSION_MATRIX = OrderedDict()
+        self.__GLOBAL_CONFUSION_MATRIX = OrderedDict()
+
+        self.NUMBER_OF_INSTANCES_OBSERVED = 0
+
+        self._TRAINING_TIME = 0
+        self._TESTING_TIME = 0
+        self._TOTAL_TRAINING_TIME = 0
+        self._TOTAL_TESTING_TIME = 0
+
+        # THE _ACTIVE ATTRIBUTE IS USED TO SHOW WHETHER A CLASSIFIER IS SUSPENDED OR NOT
+        self._ACTIVE = True
+        self._IS_READY = False
+
+        # THE SIZE OF THE PARTS OF A CLASSIFIER WHICH DO NOT GROW, WHICH IS MEASURED BY THE FIRST CALL OF
+        # memory_footprint() AND IS KEPT BY ITS RESETS AND ITS COPIES
+        self._FIXED_FOOTPRINT = None
+
+        self.__init_confusion_matrix()
+        self.__init_global_confusion_matrix()
+
+    def __init_confusion_matrix(self):
+        # self.__CONFUSION_MATRIX =
+        for real_class in self.CLASSES:
+            self.__CONFUSION_MATRIX[real_class] = OrderedDict()
+            for predicted_class in self.CLASSES:
+                self.__CONFUSION_MATRIX[real_class][predicted_class] = 0
+
+    def __init_global_confusion_matrix(self):
+        # self.__GLOBAL_CONFUSION_MATRIX =
+        for real_class in self.CLASSES:
+            self.__GLOBAL_CONFUSION_MATRIX[real_class] = OrderedDict()
+            for predicted_class in self.CLASSES:
+                self.__GLOBAL_CONFUSION_MATRIX[real_class][predicted_class] = 0
+
+    def update_confusion_matrix(self, real_class, predicted_class):
+        # THE CODE OF A CLASS IS ITS INDEX IN self.CLASSES
+        if isinstance(real_class, int):
+            real_class = self.CLASSES[real_class]
+        if isinstance(predicted_class, int):
+            predicted_class = self.CLASSES[predicted_class]
+        self.__CONFUSION_MATRIX[real_class][predicted_class] += 1
+        self.__GLOBAL_CONFUSION_MATRIX[real_class][predicted_class] += 1
+
+    def get_confusion_matrix(self):
+        return self.__CONFUSION_MATRIX
+
+    def print_confusion_matrix(self):
+        for real_class in self.CLASSES:
+            for predicted_class in self.CLASSES:
+                print(self.__CONFUSION_MATRIX[real_class][predicted_class], end="\t")
+            print()
+
+    def get_global_confusion_matrix(self):
+        return self.__GLOBAL_CONFUSION_MATRIX
+
+    def reset_confusion_matrix(self):
+        self.__init_confusion_matrix()
+
+    def is_ready(self):
+        return self._IS_READY
+
+    def set_ready(self):
+        self._IS_READY = True
+
+    def is_active(self):
+        return self._ACTIVE
+
+    def deactivate(self):
+        self._ACTIVE = False
+
+    def activate(self):
+        self._ACTIVE = True
+
+    def get_training_time(self):
+        return self._TRAINING_TIME
+
+    def get_testing_time(self):
+        return self._TESTING_TIME
+
+    def get_running_time(self):
+        return self._TRAINING_TIME + self._TESTING_TIME
+
+    def get_total_running_time(self):
+        return self._TOTAL_TRAINING_TIME + self._TOTAL_TESTING_TIME
+
+    def get_error(self):
+        return PredictionEvaluator.calculate(TornadoDic.ERROR_RATE, self.get_confusion_matrix())
+
+    def memory_footprint(self):
+        """This function returns the memory usage of the classifier in bytes, in O(1) time. The size of the parts
+        which do not grow is measured once by asizeof.asizeof(), on the first call, and the size of the
+        parts which grow, e.g. the nodes of a tree, is calculated by _get_variable_footprint() from the counters of the
+        classifier."""
+        if self._FIXED_FOOTPRINT is None:
+            self._FIXED_FOOTPRINT = MemoryEstimator.get_fixed_footprint(self)
+        return self._FIXED_FOOTPRINT + self._get_variable_footprint()
+
+    def _get_variable_footprint(self):
+        return 0
+
+    @staticmethod
+    def _get_probabilities(log_scores):
+        """This function turns an array of log-scores, one row per instance and one column per class, into
+        probabilities. The scores of each row are shifted by their maximum before they are exponentiated, so that
+        they do not underflow however many attributes are summed. A row of -inf scores gets zero probabilities."""
+        maximums = log_scores.max(axis=1, keepdims=True)
+        maximums[numpy.isinf(maximums)] = 0.0
+        probabilities = numpy.exp(log_scores - maximums)
+        sums = probabilities.sum(axis=1, keepdims=True)
+        return numpy.divide(probabilities, sums, out=numpy.zeros_like(probabilities), where=sums != 0)
+
+    def set_random_generator(self, random_generator):
+        # A CLASSIFIER WHICH DRAWS RANDOM NUMBERS OVERRIDES IT, SO THAT IT DOES NOT SHARE THE GLOBAL GENERATOR
+        pass
+
+    def _reset_stats(self):
+        # HERE I NEED TO MAKE SOME MODIFICATIONS
+        # FOR CONSIDERING CONCEPT DRIFTS.
+        self.NUMBER_OF_INSTANCES_OBSERVED = 0
+        self._TRAINING_TIME = 0
+        self._TESTING_TIME = 0
+        self._IS_READY = False
+        self._ACTIVE = True
+
+        self.reset_confusion_matrix()
+
+    def do_training(self, record):
+        t1 = time.perf_counter()
+        self.train(record)
+        t2 = time.perf_counter()
+        delta = (t2 - t1) * 1000  # in milliseconds
+        self._TRAINING_TIME += delta
+        self._TOTAL_TRAINING_TIME += delta
+
+    def train(self, record):
+        pass
+
+    def do_loading(self, record):
+        t1 = time.time()
+        self.load(record)
+        t2 = time.time()
+        delta = (t2 - t1) * 1000  # in milliseconds
+        self._TRAINING_TIME += delta
+        self._TOTAL_TRAINING_TIME += delta
+
+    def load(self, record):
+        pass
+
+    def do_testing(self, record):
+        t1 = time.time()
+        pr = self.test(record)
+        t2 = time.time()
+        delta = (t2 - t1) * 1000  # in milliseconds
+        self._TESTING_TIME += delta
+        self._TOTAL_TESTING_TIME += delta
+        return pr
+
+    def test(self, record):
+        pass
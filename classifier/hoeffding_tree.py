@@ -1,293 +1,463 @@
-"""
-The Tornado Framework
-By Ali Pesaranghader
-University of Ottawa, Ontario, Canada
-E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
----
-** The Hoeffding Tree Implementation **
-Paper: Domingos, Pedro, and Geoff Hulten. "Mining high-speed data streams."
-Published in: Proceedings of the sixth ACM SIGKDD international conference on Knowledge discovery and data mining. ACM, 2000.
-URL: https://homes.cs.washington.edu/~pedrod/papers/kdd00.pdf
-"""
-
-import gc
-import math
-import operator
-from collections import OrderedDict
-
-from classifier.classifier import SuperClassifier
-from dictionary.tornado_dictionary import TornadoDic
-
-
-def calculate_hoeffding_bound(r, delta, n):
-    epsilon = math.sqrt((math.pow(r, 2) * math.log((1 / delta), math.e)) / (2 * n))
-    return epsilon
-
-
-def calculate_entropy(x, y):
-    entropy = (-1) * (x / y) * math.log2(x / y)
-    return entropy
-
-
-def calculate_info_gain(node):
-    """This function calculate the information gain of attributes given a node."""
-
-    # CALCULATING EXPECTED INFORMATION OF WHOLE TRAINING DATA
-    expected_info_tr = 0
-    for c, v in node.CLASSES_DISTRIBUTIONS.items():
-        if v == 0:
-            continue
-        expected_info_tr += calculate_entropy(v, node.NUMBER_OF_EXAMPLES_SEEN)
-
-    # CALCULATING EXPECTED INFORMATION WITH CONSIDERING EACH ATTRIBUTE
-    # THEN CALCULATING THEIR GAINS - OR SCORES
-    for attr, values_and_distributions in node.CANDIDATE_ATTRIBUTES_VALUES_DISTRIBUTIONS.items():
-        expected_info_attr = 0
-        for value, class_distributions in values_and_distributions.items():
-            sum_classes_dist = sum(class_distributions.values())
-            expected_info_v = 0
-            for class_key, class_dist in class_distributions.items():
-                if class_dist == 0:
-                    continue
-                expected_info_v += calculate_entropy(class_dist, sum_classes_dist)
-            expected_info_attr += (sum_classes_dist / node.NUMBER_OF_EXAMPLES_SEEN) * expected_info_v
-        node.CANDIDATE_ATTRIBUTES_SCORES[attr] = expected_info_tr - expected_info_attr
-
-
-# HERE WE GO WITH THE "HOEFFDING NODE".
-class HoeffdingNode:
-
-    def __init__(self, classes, candidate_attributes):
-        # CREATING ATTRIBUTES
-        self.__ATTRIBUTE_NAME = None
-        self.NUMBER_OF_EXAMPLES_SEEN = 0
-
-        self.CLASSES_DISTRIBUTIONS = OrderedDict()
-        self.CLASSES_PROB_DISTRIBUTIONS = OrderedDict()
-
-        self.CANDIDATE_ATTRIBUTES = candidate_attributes
-
-        self.CANDIDATE_ATTRIBUTES_VALUES_DISTRIBUTIONS = OrderedDict()
-        self.CANDIDATE_ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS = OrderedDict()
-        self.CANDIDATE_ATTRIBUTES_SCORES = OrderedDict()
-
-        self.PARENT = None
-        self.BRANCHES = OrderedDict()
-        self.__CLASS = None
-
-        self.initialize_classes(classes)
-        self.initialize_attributes(classes)
-
-    def initialize_classes(self, classes):
-        for c in classes:
-            self.CLASSES_DISTRIBUTIONS[c] = 0
-            self.CLASSES_PROB_DISTRIBUTIONS[c] = 0.0
-
-    def initialize_attributes(self, classes):
-        for attribute in self.CANDIDATE_ATTRIBUTES:
-            self.CANDIDATE_ATTRIBUTES_VALUES_DISTRIBUTIONS[attribute.NAME] = OrderedDict()
-            self.CANDIDATE_ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attribute.NAME] = OrderedDict()
-            for value in attribute.POSSIBLE_VALUES:
-                self.CANDIDATE_ATTRIBUTES_VALUES_DISTRIBUTIONS[attribute.NAME][value] = OrderedDict()
-                self.CANDIDATE_ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attribute.NAME][value] = OrderedDict()
-                for c in classes:
-                    self.CANDIDATE_ATTRIBUTES_VALUES_DISTRIBUTIONS[attribute.NAME][value][c] = 0
-                    self.CANDIDATE_ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attribute.NAME][value][c] = 0.0
-
-    def set_attribute_name(self, name):
-        """This function is called when an attribute has been considered as an appropriate choice of splitting!"""
-        self.__ATTRIBUTE_NAME = name
-
-    def get_attribute_name(self):
-        return self.__ATTRIBUTE_NAME
-
-    def set_class(self, c):
-        """This function is called when the node is supposed to be labelled with the most frequent class."""
-        self.__CLASS = c
-
-    def get_class(self):
-        c = self.__CLASS
-        return c
-
-    def get_child_node(self, value):
-        return self.BRANCHES[value]
-
-
-class HoeffdingTree(SuperClassifier):
-    """This is the implementation of Hoeffding Tree which is also known as Very Fast Decision Tree (VFDT)
-    in the literature. Hoeffding Tree is an incremental decision tree for particularly learning from data streams."""
-
-    LEARNER_NAME = TornadoDic.HOEFFDING_TREE
-    LEARNER_TYPE = TornadoDic.TRAINABLE
-    LEARNER_CATEGORY = TornadoDic.NOM_CLASSIFIER
-
-    def __init__(self, classes, attributes, delta=0.0000001, tie=0.05, n_min=200, leaf_prediction_mode=TornadoDic.NB,
-                 max_memory_size=33554432, memory_check_step=1000000):
-
-        super().__init__(classes, attributes)
-        self.__ROOT = HoeffdingNode(classes, attributes)
-
-        self.ATTRIBUTES_NAMES = []
-
-        self.__DELTA = delta
-        self.__TIE = tie
-        self.__R = math.log2(len(classes))
-        self.__N_min = n_min
-
-        self.__MAX_MEMORY_SIZE = max_memory_size
-        self.__MEMORY_CHECK_STEP = memory_check_step
-
-        self.__PREDICTION_MODE = leaf_prediction_mode
-
-        self.__set_attributes_names()
-
-    def __set_attributes_names(self):
-        for attribute in self.ATTRIBUTES:
-            self.ATTRIBUTES_NAMES.append(attribute.NAME)
-
-    def get_root(self):
-        return self.__ROOT
-
-    def __trace(self, instance):
-        current_node = self.__ROOT
-        while len(current_node.BRANCHES) != 0:
-            index = self.ATTRIBUTES_NAMES.index(current_node.get_attribute_name())
-            current_node = current_node.get_child_node(instance[index])
-        return current_node
-
-    def train(self, instance):
-
-        x, y = instance[:-1], instance[-1]
-
-        node = self.__trace(x)
-
-        node.NUMBER_OF_EXAMPLES_SEEN += 1
-        node.CLASSES_DISTRIBUTIONS[y] += 1
-
-        if self.__PREDICTION_MODE == TornadoDic.NB:
-
-            for c in self.CLASSES:
-                node.CLASSES_PROB_DISTRIBUTIONS[c] = node.CLASSES_DISTRIBUTIONS[c] / node.NUMBER_OF_EXAMPLES_SEEN
-
-            for i in range(0, len(x)):
-                attribute, value = self.ATTRIBUTES[i], x[i]
-                if node.CANDIDATE_ATTRIBUTES.__contains__(attribute):
-                    node.CANDIDATE_ATTRIBUTES_VALUES_DISTRIBUTIONS[attribute.NAME][value][y] += 1
-
-            for c, c_prob in node.CLASSES_DISTRIBUTIONS.items():
-                for attr in node.CANDIDATE_ATTRIBUTES:
-                    attr_name = attr.NAME
-                    k = len(node.CANDIDATE_ATTRIBUTES_VALUES_DISTRIBUTIONS[attr_name])
-                    for value in attr.POSSIBLE_VALUES:
-                        d = node.CANDIDATE_ATTRIBUTES_VALUES_DISTRIBUTIONS[attr_name][value][c]
-                        node.CANDIDATE_ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attr_name][value][c] = (d + 1) / (k + c_prob)
-
-        most_populated_class = max(node.CLASSES_DISTRIBUTIONS.items(), key=operator.itemgetter(1))
-        node.set_class(most_populated_class)
-
-        if (node.NUMBER_OF_EXAMPLES_SEEN - 1) != most_populated_class[1]:
-            calculate_info_gain(node)
-
-        if node.NUMBER_OF_EXAMPLES_SEEN >= self.__N_min and len(node.CANDIDATE_ATTRIBUTES_SCORES) != 0:
-
-            g1, g2 = self.__get_two_attributes_with_highest_scores(node.CANDIDATE_ATTRIBUTES_SCORES)
-            epsilon = calculate_hoeffding_bound(self.__R, self.__DELTA, node.NUMBER_OF_EXAMPLES_SEEN)
-            if g1[1] - g2[1] > epsilon or epsilon < self.__TIE:
-                node.set_attribute_name(g1[0])
-                new_attributes_set = self.ATTRIBUTES.copy()
-                attribute_index = self.ATTRIBUTES_NAMES.index(g1[0])
-                del new_attributes_set[attribute_index]
-                for value in self.ATTRIBUTES[attribute_index].POSSIBLE_VALUES:
-                    leaf = HoeffdingNode(self.CLASSES, new_attributes_set)
-                    node.BRANCHES[value] = leaf
-                    leaf.PARENT = node
-
-    def print_tree(self, node, c=""):
-        c += "\t"
-        print(c + node.get_attribute_name() + " " + str(node.CLASSES_DISTRIBUTIONS))
-        for branch, child in node.BRANCHES.items():
-            print(c + ">" + branch + "<")
-            if child.get_attribute_name() is not None:
-                self.print_tree(child, c)
-            else:
-                print(c + str(child.PARENT.get_class()))
-
-    def test(self, instance):
-        if self._IS_READY:
-            x = instance[0:len(instance) - 1]
-            y = instance[len(instance) - 1]
-            node = self.__trace(x)
-
-            if node.get_class() is None:
-                node = node.PARENT
-
-            if self.__PREDICTION_MODE == TornadoDic.MC:
-                prediction = node.get_class()[0]
-            else:
-                predictions = OrderedDict()
-                for c in node.CLASSES_DISTRIBUTIONS.keys():
-                    pr = node.CLASSES_PROB_DISTRIBUTIONS[c]
-                    for attr_index in range(0, len(x)):
-                        if node.CANDIDATE_ATTRIBUTES.__contains__(self.ATTRIBUTES[attr_index]):
-                            attr = self.ATTRIBUTES[attr_index]
-                            value = x[attr_index]
-                            pr *= node.CANDIDATE_ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attr.NAME][value][c]
-                    predictions[c] = pr
-                prediction = max(predictions.items(), key=operator.itemgetter(1))[0]
-
-            self.update_confusion_matrix(y, prediction)
-
-            return prediction
-
-        else:
-            print("Please train a Hoeffding Tree classifier first.")
-            exit()
-
-    def get_prediction_prob(self, X):
-
-        node = self.__trace(X)
-
-        if node.get_class() is None:
-            node = node.PARENT
-
-        prob = []
-        if self.__PREDICTION_MODE == TornadoDic.MC:
-            for c in self.CLASSES:
-                prob.append(node.CLASSES_PROB_DISTRIBUTIONS[c])
-        else:
-            for c in self.CLASSES:
-                pr = node.CLASSES_PROB_DISTRIBUTIONS[c]
-                for attr_index in range(0, len(X)):
-                    if node.CANDIDATE_ATTRIBUTES.__contains__(self.ATTRIBUTES[attr_index]):
-                        attr = self.ATTRIBUTES[attr_index]
-                        value = X[attr_index]
-                        pr *= node.CANDIDATE_ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attr.NAME][value][c]
-                prob.append(pr)
-
-            prob_sum = sum(prob)
-            if prob_sum != 0.0:
-                prob = [x / prob_sum for x in prob]
-            else:
-                prob = [0.0 for x in prob]
-
-        pred_prob = {}
-        for i, c in enumerate(self.CLASSES):
-            pred_prob[c] = prob[i]
-
-        return pred_prob
-
-    @staticmethod
-    def __get_two_attributes_with_highest_scores(attributes_scores):
-        sorted_attributes_scores = sorted(attributes_scores.items(), key=operator.itemgetter(1), reverse=True)
-        g1 = sorted_attributes_scores[0]
-        if len(sorted_attributes_scores) >= 2:
-            g2 = sorted_attributes_scores[1]
-        else:
-            g2 = (0, 0)
-        return g1, g2
-
-    def reset(self):
-        super()._reset_stats()
-        del self.__ROOT
-        gc.collect()
-        self.__ROOT = HoeffdingNode(self.CLASSES, self.ATTRIBUTES)
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+---
+** The Hoeffding Tree Implementation **
+Paper: Domingos, Pedro, and Geoff Hulten. "Mining high-speed data streams."
+Published in: Proceedings of the sixth ACM SIGKDD international conference on Knowledge discovery and data mining. ACM, 2000.
+URL: https://homes.cs.washington.edu/~pedrod/papers/kdd00.pdf
+"""
+
+import gc
+import math
+import sys
+from collections import OrderedDict
+
+import numpy
+
+from classifier.classifier import SuperClassifier
+from dictionary.tornado_dictionary import TornadoDic
+
+
+def calculate_hoeffding_bound(r, delta, n):
+    epsilon = math.sqrt((math.pow(r, 2) * math.log((1 / delta), math.e)) / (2 * n))
+    return epsilon
+
+
+def calculate_entropy(x, y):
+    entropy = (-1) * (x / y) * math.log2(x / y)
+    return entropy
+
+
+def calculate_entropies(counts):
+    """This function calculates the entropy of each class distribution given by the last axis of an array of counts.
+    The entropy of an empty distribution is zero."""
+    totals = counts.sum(axis=-1, keepdims=True)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        probabilities = counts / totals
+        terms = numpy.where(counts != 0, probabilities * numpy.log2(probabilities), 0.0)
+    return -terms.sum(axis=-1)
+
+
+def calculate_info_gain(node):
+    """This function calculate the information gain of the candidate attributes of a node, in their order. Their
+    counts form one array of attributes x values x classes, padded with empty distributions, so that the entropies of
+    all of them are calculated at once."""
+
+    # CALCULATING EXPECTED INFORMATION OF WHOLE TRAINING DATA
+    expected_info_tr = calculate_entropies(node.get_active_classes_counts())
+
+    # IN THE MC MODE, THE COUNTS OF THE VALUES ARE NOT COLLECTED, SO ALL THE ATTRIBUTES HAVE THE SAME GAIN
+    if node.COUNTS is None:
+        return numpy.full(len(node.CANDIDATE_ATTRIBUTES), expected_info_tr)
+
+    # CALCULATING EXPECTED INFORMATION WITH CONSIDERING EACH ATTRIBUTE
+    # THEN CALCULATING THEIR GAINS - OR SCORES
+    counts = node.COUNTS[node.CANDIDATE_ATTRIBUTES]
+    values_weights = counts.sum(axis=2) / node.get_number_of_active_examples()
+    expected_info_attr = (values_weights * calculate_entropies(counts)).sum(axis=1)
+    return expected_info_tr - expected_info_attr
+
+
+# HERE WE GO WITH THE "HOEFFDING NODE".
+class HoeffdingNode:
+    """This class keeps the statistics of a node in arrays, rather than in dictionaries. COUNTS is one array of
+    attributes x values x classes, i.e. the number of examples per class for each value of each attribute, where the
+    values of an attribute are given by their codes, and the attributes having less values than the others are padded.
+    CANDIDATE_ATTRIBUTES is an array of the indexes of the attributes considered for splitting, which is shared by the
+    siblings. The fields of a node are kept in slots, so that a node has no dictionary of its own.
+    COUNTS is only allocated by the tree once an active leaf is trained, so that a split only creates small nodes, and
+    it is dropped when the leaf is deactivated. Once the leaf is split, it is kept until UNTRAINED_CHILDREN, i.e. the
+    number of its children which have seen no example yet, falls to zero, since such a child is scored by its parent."""
+
+    __slots__ = ["__ATTRIBUTE_NAME", "ATTRIBUTE_INDEX", "NUMBER_OF_EXAMPLES_SEEN", "LAST_EVALUATION", "ACTIVE",
+                 "EXAMPLES_SEEN_AT_ACTIVATION", "CLASSES_COUNTS_AT_ACTIVATION", "CLASSES",
+                 "CLASSES_COUNTS", "CANDIDATE_ATTRIBUTES", "COUNTS", "PARENT", "BRANCHES", "UNTRAINED_CHILDREN",
+                 "__CLASS"]
+
+    def __init__(self, classes, candidate_attributes):
+        # CREATING ATTRIBUTES
+        self.__ATTRIBUTE_NAME = None
+        self.ATTRIBUTE_INDEX = None
+        self.NUMBER_OF_EXAMPLES_SEEN = 0
+        # THE NUMBER OF EXAMPLES SEEN WHEN THE SCORES OF THE CANDIDATE ATTRIBUTES WERE LAST CALCULATED
+        self.LAST_EVALUATION = 0
+
+        # AN INACTIVE LEAF, AS AN INNER NODE, KEEPS ITS CLASS COUNTS ONLY. THE COUNTS OF THE VALUES OF ITS CANDIDATE
+        # ATTRIBUTES ARE DROPPED, AND THEY ARE COLLECTED AGAIN, FROM THE NEXT EXAMPLE, ONCE IT IS ACTIVATED.
+        self.ACTIVE = True
+        self.EXAMPLES_SEEN_AT_ACTIVATION = 0
+        self.CLASSES_COUNTS_AT_ACTIVATION = None
+
+        self.CLASSES = classes
+        self.CLASSES_COUNTS = numpy.zeros(len(classes), dtype=numpy.int64)
+
+        self.CANDIDATE_ATTRIBUTES = candidate_attributes
+        self.COUNTS = None
+
+        self.PARENT = None
+        self.BRANCHES = OrderedDict()
+        self.UNTRAINED_CHILDREN = 0
+        self.__CLASS = None
+
+    def set_attribute_name(self, name):
+        """This function is called when an attribute has been considered as an appropriate choice of splitting!"""
+        self.__ATTRIBUTE_NAME = name
+
+    def get_attribute_name(self):
+        return self.__ATTRIBUTE_NAME
+
+    def set_class(self, c):
+        """This function is called when the node is supposed to be labelled with the most frequent class."""
+        self.__CLASS = c
+
+    def get_class(self):
+        c = self.__CLASS
+        return c
+
+    def get_child_node(self, value):
+        return self.BRANCHES[value]
+
+    def get_classes_distributions(self):
+        return OrderedDict(zip(self.CLASSES, self.CLASSES_COUNTS.tolist()))
+
+    def get_number_of_active_examples(self):
+        """This function returns the number of examples the counts of the values are collected from."""
+        return self.NUMBER_OF_EXAMPLES_SEEN - self.EXAMPLES_SEEN_AT_ACTIVATION
+
+    def get_active_classes_counts(self):
+        """This function returns the class counts of the examples the counts of the values are collected from."""
+        if self.CLASSES_COUNTS_AT_ACTIVATION is None:
+            return self.CLASSES_COUNTS
+        return self.CLASSES_COUNTS - self.CLASSES_COUNTS_AT_ACTIVATION
+
+    def get_promise(self):
+        """This function returns the number of examples seen by the leaf which are not of its most populated class,
+        i.e. the number of errors a split could fix."""
+        return self.NUMBER_OF_EXAMPLES_SEEN - int(self.CLASSES_COUNTS.max())
+
+    def deactivate(self):
+        self.ACTIVE = False
+        self.COUNTS = None
+        self.CLASSES_COUNTS_AT_ACTIVATION = None
+
+    def activate(self):
+        self.ACTIVE = True
+        self.EXAMPLES_SEEN_AT_ACTIVATION = self.NUMBER_OF_EXAMPLES_SEEN
+        self.LAST_EVALUATION = self.NUMBER_OF_EXAMPLES_SEEN
+        self.CLASSES_COUNTS_AT_ACTIVATION = self.CLASSES_COUNTS.copy()
+
+    def get_counts_footprint(self):
+        """This function returns the size of the arrays which an active leaf holds, and which an inactive leaf, or an
+        inner node, drops."""
+        size = 0
+        for counts in [self.COUNTS, self.CLASSES_COUNTS_AT_ACTIVATION]:
+            if counts is not None:
+                size += sys.getsizeof(counts)
+        return size
+
+    def get_footprint(self):
+        """This function returns the size of the node in bytes, i.e. the ones of its slots, its arrays and its
+        branches. The classes, the candidate attributes, and the other nodes it refers to are not counted."""
+        return sys.getsizeof(self) + sys.getsizeof(self.BRANCHES) + sys.getsizeof(self.CLASSES_COUNTS) + \
+            self.get_counts_footprint()
+
+
+class HoeffdingTree(SuperClassifier):
+    """This is the implementation of Hoeffding Tree which is also known as Very Fast Decision Tree (VFDT)
+    in the literature. Hoeffding Tree is an incremental decision tree for particularly learning from data streams.
+    A leaf is considered for splitting once it has seen n_min examples, and then every grace_period examples, i.e.
+    the information gains of its candidate attributes are only calculated when a split is attempted. By default, a
+    split is attempted on every example, as it always was, while a grace period of e.g. 200, as in VFDT, makes
+    training much faster at the cost of splitting later.
+    Every memory_check_step examples, the size of the tree is estimated. If it exceeds max_memory_size, or if some
+    leaves are inactive, the leaves are ranked by their promise, and the most promising ones which fit in the memory
+    are kept, or made, active, while the others are deactivated, i.e. they drop their distributions of values and
+    only predict their most populated class, as in VFDT."""
+
+    LEARNER_NAME = TornadoDic.HOEFFDING_TREE
+    LEARNER_TYPE = TornadoDic.TRAINABLE
+    LEARNER_CATEGORY = TornadoDic.NOM_CLASSIFIER
+
+    def __init__(self, classes, attributes, delta=0.0000001, tie=0.05, n_min=200, leaf_prediction_mode=TornadoDic.NB,
+                 max_memory_size=33554432, memory_check_step=1000000, grace_period=1):
+
+        super().__init__(classes, attributes)
+
+        self.ATTRIBUTES_NAMES = []
+        self.VALUES_CODES = []
+        self.CLASSES_CODES = {c: code for code, c in enumerate(classes)}
+        self.__set_attributes_names()
+
+        # THE NUMBER OF VALUES OF EACH ATTRIBUTE, AND THE SHAPE OF THE COUNTS OF A NODE
+        self.__ATTRIBUTES_SIZES = numpy.array([len(attribute.POSSIBLE_VALUES) for attribute in attributes])
+        self.__COUNTS_SHAPE = (len(attributes), int(self.__ATTRIBUTES_SIZES.max(initial=0)), len(classes))
+
+        # THE SIZE OF THE ARRAYS OF AN ACTIVE LEAF, I.E. ITS COUNTS, WHICH ARE ONLY COLLECTED IN THE NB MODE, AND ITS
+        # CLASS COUNTS AT ITS LAST ACTIVATION
+        self.__COUNTS_FOOTPRINT = sys.getsizeof(numpy.zeros(len(classes), dtype=numpy.int64))
+        if leaf_prediction_mode == TornadoDic.NB:
+            self.__COUNTS_FOOTPRINT += sys.getsizeof(numpy.zeros(self.__COUNTS_SHAPE, dtype=numpy.int64))
+
+        self.__ROOT = HoeffdingNode(classes, numpy.arange(len(attributes)))
+        # THE SIZE OF ALL THE NODES, WHICH IS UPDATED WHENEVER NODES ARE CREATED, SPLIT, DEACTIVATED, OR ACTIVATED,
+        # AND WHENEVER THE COUNTS OF A LEAF ARE ALLOCATED
+        self.__NODES_FOOTPRINT = self.__ROOT.get_footprint()
+        self.__NUMBER_OF_INACTIVE_LEAVES = 0
+
+        self.__DELTA = delta
+        self.__TIE = tie
+        self.__R = math.log2(len(classes))
+        self.__N_min = n_min
+        self.__GRACE_PERIOD = grace_period
+
+        self.__MAX_MEMORY_SIZE = max_memory_size
+        self.__MEMORY_CHECK_STEP = memory_check_step
+
+        self.__PREDICTION_MODE = leaf_prediction_mode
+
+    def __set_attributes_names(self):
+        for attribute in self.ATTRIBUTES:
+            self.ATTRIBUTES_NAMES.append(attribute.NAME)
+            self.VALUES_CODES.append({v: code for code, v in enumerate(attribute.POSSIBLE_VALUES)})
+
+    def __get_values_codes(self, x, attributes_indexes):
+        return [self.VALUES_CODES[i][x[i]] for i in attributes_indexes.tolist()]
+
+    def get_root(self):
+        return self.__ROOT
+
+    def _get_variable_footprint(self):
+        return self.__NODES_FOOTPRINT
+
+    def __trace(self, instance):
+        current_node = self.__ROOT
+        while len(current_node.BRANCHES) != 0:
+            current_node = current_node.get_child_node(instance[current_node.ATTRIBUTE_INDEX])
+        return current_node
+
+    def train(self, instance):
+
+        self.NUMBER_OF_INSTANCES_OBSERVED += 1
+        if self.NUMBER_OF_INSTANCES_OBSERVED % self.__MEMORY_CHECK_STEP == 0:
+            self.__manage_memory()
+
+        x, y = instance[:-1], instance[-1]
+
+        node = self.__trace(x)
+
+        node.NUMBER_OF_EXAMPLES_SEEN += 1
+        y_code = self.CLASSES_CODES[y]
+        node.CLASSES_COUNTS[y_code] += 1
+
+        # ONCE EVERY CHILD OF A SPLIT HAS SEEN AN EXAMPLE, NONE IS SCORED BY THE PARENT, WHICH DROPS ITS COUNTS
+        if node.NUMBER_OF_EXAMPLES_SEEN == 1 and node.PARENT is not None:
+            parent = node.PARENT
+            parent.UNTRAINED_CHILDREN -= 1
+            if parent.UNTRAINED_CHILDREN == 0:
+                self.__NODES_FOOTPRINT -= parent.get_counts_footprint()
+                parent.deactivate()
+
+        # AN INACTIVE LEAF ONLY KEEPS ITS CLASS COUNTS, AS DOES ANY LEAF IN THE MC MODE, WHICH PREDICTS BY THEM ONLY
+        if node.ACTIVE and self.__PREDICTION_MODE == TornadoDic.NB:
+            if node.COUNTS is None:
+                node.COUNTS = numpy.zeros(self.__COUNTS_SHAPE, dtype=numpy.int64)
+                self.__NODES_FOOTPRINT += sys.getsizeof(node.COUNTS)
+            candidate_attributes = node.CANDIDATE_ATTRIBUTES
+            node.COUNTS[candidate_attributes, self.__get_values_codes(x, candidate_attributes), y_code] += 1
+
+        most_populated_class_code = int(node.CLASSES_COUNTS.argmax())
+        most_populated_class = (self.CLASSES[most_populated_class_code],
+                                int(node.CLASSES_COUNTS[most_populated_class_code]))
+        node.set_class(most_populated_class)
+
+        if node.ACTIVE is False or node.get_number_of_active_examples() < self.__N_min or \
+                node.NUMBER_OF_EXAMPLES_SEEN - node.LAST_EVALUATION < self.__GRACE_PERIOD:
+            return
+        node.LAST_EVALUATION = node.NUMBER_OF_EXAMPLES_SEEN
+
+        # THE GAINS OF A LEAF HAVING AT MOST ONE EXAMPLE OUT OF ITS MOST POPULATED CLASS ARE THE ONES OF A PURE LEAF
+        if node.NUMBER_OF_EXAMPLES_SEEN - most_populated_class[1] > 1:
+            scores = calculate_info_gain(node)
+        else:
+            scores = numpy.zeros(len(node.CANDIDATE_ATTRIBUTES))
+
+        if len(scores) != 0:
+
+            g1, g2 = self.__get_two_attributes_with_highest_scores(node.CANDIDATE_ATTRIBUTES, scores)
+            epsilon = calculate_hoeffding_bound(self.__R, self.__DELTA, node.get_number_of_active_examples())
+            if g1[1] - g2[1] > epsilon or epsilon < self.__TIE:
+                attribute_index = g1[0]
+                node.set_attribute_name(self.ATTRIBUTES_NAMES[attribute_index])
+                node.ATTRIBUTE_INDEX = attribute_index
+                # THE NEW LEAVES SHARE THEIR CANDIDATE ATTRIBUTES, I.E. ALL THE ATTRIBUTES BUT THE SPLIT ONE
+                candidate_attributes = numpy.delete(numpy.arange(len(self.ATTRIBUTES)), attribute_index)
+                self.__NODES_FOOTPRINT += sys.getsizeof(candidate_attributes)
+                branches_footprint = sys.getsizeof(node.BRANCHES)
+                for value in self.ATTRIBUTES[attribute_index].POSSIBLE_VALUES:
+                    leaf = HoeffdingNode(self.CLASSES, candidate_attributes)
+                    node.BRANCHES[value] = leaf
+                    leaf.PARENT = node
+                    self.__NODES_FOOTPRINT += leaf.get_footprint()
+                self.__NODES_FOOTPRINT += sys.getsizeof(node.BRANCHES) - branches_footprint
+                # THE NODE KEEPS ITS COUNTS UNTIL EVERY NEW LEAF HAS SEEN AN EXAMPLE, SO THAT THE NEW LEAVES WHICH HAVE
+                # SEEN NONE YET ARE SCORED AS THE NODE WAS
+                node.UNTRAINED_CHILDREN = len(node.BRANCHES)
+
+    def __get_leaves(self):
+        leaves = []
+        nodes = [self.__ROOT]
+        while len(nodes) != 0:
+            node = nodes.pop()
+            if len(node.BRANCHES) == 0:
+                leaves.append(node)
+            else:
+                nodes.extend(node.BRANCHES.values())
+        return leaves
+
+    def __manage_memory(self):
+        """This function keeps the tree within max_memory_size. The leaves are visited from the most promising one,
+        and they are kept, or made, active as long as their counts fit in the memory left by the rest of the tree,
+        where the counts of an active leaf are taken as allocated. The remaining leaves are deactivated."""
+        if self.__NUMBER_OF_INACTIVE_LEAVES == 0 and self.memory_footprint() <= self.__MAX_MEMORY_SIZE:
+            return
+
+        leaves = self.__get_leaves()
+        leaves.sort(key=lambda leaf: leaf.get_promise(), reverse=True)
+
+        counts_footprint = self.__COUNTS_FOOTPRINT
+        available_memory = self.__MAX_MEMORY_SIZE - self.memory_footprint() + \
+            sum(leaf.get_counts_footprint() for leaf in leaves)
+
+        fits = True
+        for leaf in leaves:
+            fits = fits and counts_footprint <= available_memory
+            if fits:
+                available_memory -= counts_footprint
+                if leaf.ACTIVE is False:
+                    leaf.activate()
+                    self.__NUMBER_OF_INACTIVE_LEAVES -= 1
+                    self.__NODES_FOOTPRINT += leaf.get_counts_footprint()
+            elif leaf.ACTIVE is True:
+                self.__NODES_FOOTPRINT -= leaf.get_counts_footprint()
+                leaf.deactivate()
+                self.__NUMBER_OF_INACTIVE_LEAVES += 1
+
+    def get_number_of_inactive_leaves(self):
+        return self.__NUMBER_OF_INACTIVE_LEAVES
+
+    def print_tree(self, node, c=""):
+        c += "\t"
+        print(c + node.get_attribute_name() + " " + str(node.get_classes_distributions()))
+        for branch, child in node.BRANCHES.items():
+            print(c + ">" + branch + "<")
+            if child.get_attribute_name() is not None:
+                self.print_tree(child, c)
+            else:
+                print(c + str(child.PARENT.get_class()))
+
+    def test(self, instance):
+        if self._IS_READY:
+            x = instance[0:len(instance) - 1]
+            y = instance[len(instance) - 1]
+            node = self.__trace(x)
+
+            if node.get_class() is None:
+                node = node.PARENT
+
+            if self.__PREDICTION_MODE == TornadoDic.MC:
+                prediction = node.get_class()[0]
+            else:
+                log_scores = self.__get_log_scores(node, x)
+                prediction = self.CLASSES[int(log_scores.argmax())]
+
+            self.update_confusion_matrix(y, prediction)
+
+            return prediction
+
+        else:
+            print("Please train a Hoeffding Tree classifier first.")
+            exit()
+
+    def __get_log_probabilities(self, node):
+        """This function returns the logarithms of the probabilities of the values of the candidate attributes of an
+        active node given each class, as an array of attributes x values x classes. They are derived from the counts,
+        as (count + 1) / (number of values + class count), so that a freshly activated leaf, having no counts,
+        considers the values as equally probable."""
+        candidate_attributes = node.CANDIDATE_ATTRIBUTES
+        probabilities = (node.COUNTS[candidate_attributes] + 1) / \
+            (self.__ATTRIBUTES_SIZES[candidate_attributes, None, None] + node.get_active_classes_counts())
+        return numpy.log(probabilities)
+
+    def __get_log_scores(self, node, x):
+        """This function returns the log-score of each class given the leaf of an instance, i.e. the logarithm of the
+        probability of the class plus the ones of the values of the candidate attributes given the class. The sums
+        of logarithms do not underflow to zero, as the products of probabilities do for wide records."""
+        with numpy.errstate(divide="ignore"):
+            log_scores = numpy.log(node.CLASSES_COUNTS / node.NUMBER_OF_EXAMPLES_SEEN)
+        # AN INACTIVE LEAF, OR AN INNER NODE, HAS NO COUNTS OF VALUES, SO ITS SCORES ARE THE ONES OF ITS CLASSES
+        if node.COUNTS is not None and len(node.CANDIDATE_ATTRIBUTES) != 0:
+            log_probabilities = self.__get_log_probabilities(node)
+            values_codes = self.__get_values_codes(x, node.CANDIDATE_ATTRIBUTES)
+            log_scores = numpy.add.reduce(numpy.vstack(
+                [log_scores, log_probabilities[numpy.arange(len(values_codes)), values_codes]]), axis=0)
+        return log_scores
+
+    def get_prediction_prob(self, X):
+        probabilities = self.predict_proba_many([X])[0].tolist()
+        return {c: probabilities[i] for i, c in enumerate(self.CLASSES)}
+
+    def predict_proba_many(self, X):
+        """This function returns the probabilities of the classes given a block of instances, i.e. records without
+        their labels, as an array of one row per instance and one column per class, in the order of the labels.
+        The instances are traced down to their leaves, and the ones reaching the same leaf are scored together.
+        In the MC mode, their probabilities are the frequencies of the classes at the leaf. In the NB mode, the
+        logarithms of the probabilities of their values are gathered from the table of the leaf, and summed."""
+        probabilities = numpy.zeros((len(X), len(self.CLASSES)))
+        leaves = OrderedDict()
+        for i in range(0, len(X)):
+            node = self.__trace(X[i])
+            if node.get_class() is None:
+                node = node.PARENT
+            # THE ROOT IS NOT LABELLED BEFORE THE TREE IS TRAINED, SO ITS INSTANCES GET ZERO PROBABILITIES
+            if node is not None:
+                leaves.setdefault(node, []).append(i)
+
+        for node, indexes in leaves.items():
+            if self.__PREDICTION_MODE == TornadoDic.MC:
+                probabilities[indexes] = node.CLASSES_COUNTS / node.NUMBER_OF_EXAMPLES_SEEN
+                continue
+            with numpy.errstate(divide="ignore"):
+                log_scores = numpy.tile(numpy.log(node.CLASSES_COUNTS / node.NUMBER_OF_EXAMPLES_SEEN),
+                                        (len(indexes), 1))
+            if node.COUNTS is not None:
+                log_probabilities = self.__get_log_probabilities(node)
+                values_codes = numpy.array([self.__get_values_codes(X[i], node.CANDIDATE_ATTRIBUTES)
+                                            for i in indexes]).reshape(len(indexes), -1)
+                for j in range(0, values_codes.shape[1]):
+                    log_scores += log_probabilities[j, values_codes[:, j]]
+            probabilities[indexes] = self._get_probabilities(log_scores)
+
+        return probabilities
+
+    @staticmethod
+    def __get_two_attributes_with_highest_scores(attributes_indexes, attributes_scores):
+        """This function returns the (index, score) pairs of the two attributes with the highest scores. The ties are
+        broken by the order of the attributes."""
+        ranking = numpy.argsort(-attributes_scores, kind="stable")
+        g1 = (int(attributes_indexes[ranking[0]]), float(attributes_scores[ranking[0]]))
+        if len(ranking) >= 2:
+            g2 = (int(attributes_indexes[ranking[1]]), float(attributes_scores[ranking[1]]))
+        else:
+            g2 = (0, 0)
+        return g1, g2
+
+    def reset(self):
+        super()._reset_stats()
+        del self.__ROOT
+        gc.collect()
+        self.__ROOT = HoeffdingNode(self.CLASSES, numpy.arange(len(self.ATTRIBUTES)))
+        self.__NODES_FOOTPRINT = self.__ROOT.get_footprint()
+        self.__NUMBER_OF_INACTIVE_LEAVES = 0
@@ -1,160 +1,212 @@
-"""
-The Tornado Framework
-By Ali Pesaranghader
-University of Ottawa, Ontario, Canada
-E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
-"""
-
-import operator
-from collections import OrderedDict
-
-from classifier.classifier import SuperClassifier
-from dictionary.tornado_dictionary import TornadoDic
-
-
-class NaiveBayes(SuperClassifier):
-    """This is the implementation of incremental naive bayes classifier for learning from data streams."""
-
-    LEARNER_NAME = TornadoDic.NAIVE_BAYES
-    LEARNER_TYPE = TornadoDic.TRAINABLE
-    LEARNER_CATEGORY = TornadoDic.NOM_CLASSIFIER
-
-    def __init__(self, labels, attributes, smoothing_parameter=1):
-
-        super().__init__(labels, attributes)
-
-        self.ATTRIBUTES_NAMES = []
-        self.ALPHA = smoothing_parameter
-
-        self.CLASSES_DISTRIBUTIONS = OrderedDict()
-        self.CLASSES_PROB_DISTRIBUTIONS = OrderedDict()
-
-        self.ATTRIBUTES_VALUES_DISTRIBUTIONS = OrderedDict()
-        self.ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS = OrderedDict()
-
-        self.__initialize_classes()
-        self.__initialize_attributes()
-
-    def __initialize_classes(self):
-        for c in self.CLASSES:
-            self.CLASSES_DISTRIBUTIONS[c] = 0
-            self.CLASSES_PROB_DISTRIBUTIONS[c] = 0.0
-
-    def __initialize_attributes(self):
-        for attr in self.ATTRIBUTES:
-            self.ATTRIBUTES_NAMES.append(attr.NAME)
-            self.ATTRIBUTES_VALUES_DISTRIBUTIONS[attr.NAME] = OrderedDict()
-            self.ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attr.NAME] = OrderedDict()
-            for v in attr.POSSIBLE_VALUES:
-                self.ATTRIBUTES_VALUES_DISTRIBUTIONS[attr.NAME][v] = OrderedDict()
-                self.ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attr.NAME][v] = OrderedDict()
-                for c in self.CLASSES:
-                    self.ATTRIBUTES_VALUES_DISTRIBUTIONS[attr.NAME][v][c] = 0
-                    self.ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attr.NAME][v][c] = 0.0
-
-    def train(self, instance):
-        self.NUMBER_OF_INSTANCES_OBSERVED += 1
-        self.__set_class_dist(instance)
-        self.__set_attr_val_dist(instance)
-
-    def __set_class_dist(self, instance):
-        y = instance[len(instance) - 1]
-        try:
-            self.CLASSES_DISTRIBUTIONS[y] += 1
-        except:
-            print("ERROR")
-        for y in self.CLASSES_DISTRIBUTIONS.keys():
-            self.CLASSES_PROB_DISTRIBUTIONS[y] = self.CLASSES_DISTRIBUTIONS[y] / self.NUMBER_OF_INSTANCES_OBSERVED
-
-    def get_classes_dist(self):
-        return self.CLASSES_DISTRIBUTIONS
-
-    def __set_attr_val_dist(self, instance):
-        ln = len(instance)
-        x = instance[0:ln - 1]
-        y = instance[ln - 1]
-        '''
-        for attr_index in range(0, len(x)):
-            attr = self.ATTRIBUTES_NAMES[attr_index]
-            value = x[attr_index]
-            self.ATTRIBUTES_VALUES_DISTRIBUTIONS[attr][value][y] += 1
-            for c, c_dist in self.CLASSES_DISTRIBUTIONS.items():
-                d = self.ATTRIBUTES_VALUES_DISTRIBUTIONS[attr][value][c]
-                k = len(self.ATTRIBUTES_VALUES_DISTRIBUTIONS[attr])
-                self.ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attr][value][c] = (d + 1) / (k + c_dist)
-        '''
-        for attr_index in range(0, len(x)):
-            attr = self.ATTRIBUTES_NAMES[attr_index]
-            value = x[attr_index]
-            self.ATTRIBUTES_VALUES_DISTRIBUTIONS[attr][value][y] += 1
-
-        for c, c_dist in self.CLASSES_DISTRIBUTIONS.items():
-            for attr in self.ATTRIBUTES:
-                attr_name = attr.NAME
-                k = len(self.ATTRIBUTES_VALUES_DISTRIBUTIONS[attr_name])
-                for value in attr.POSSIBLE_VALUES:
-                    d = self.ATTRIBUTES_VALUES_DISTRIBUTIONS[attr_name][value][c]
-                    self.ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attr_name][value][c] = (d + 1) / (k + c_dist)
-
-    def test(self, instance):
-        if self._IS_READY:
-            predictions = OrderedDict()
-            x = instance[0:len(instance) - 1]
-            y = instance[len(instance) - 1]
-            for c in self.CLASSES:
-                pr = self.CLASSES_PROB_DISTRIBUTIONS[c]
-                for attr_index in range(0, len(x)):
-                    attr = self.ATTRIBUTES_NAMES[attr_index]
-                    value = x[attr_index]
-                    pr *= self.ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attr][value][c]
-                predictions[c] = pr
-
-            predicted_class = max(predictions.items(), key=operator.itemgetter(1))[0]
-            self.update_confusion_matrix(y, predicted_class)
-            return predicted_class
-        else:
-            print("Please train a Naive Bayes classifier first.")
-            exit()
-
-    def get_prediction_prob(self, X):
-
-        prob = []
-        for c in self.CLASSES:
-            pr = self.CLASSES_PROB_DISTRIBUTIONS[c]
-            for attr_index in range(0, len(X)):
-                attr = self.ATTRIBUTES_NAMES[attr_index]
-                value = X[attr_index]
-                pr *= self.ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attr][value][c]
-                if self.ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS[attr][value][c] == 0:
-                    print("HI")
-            prob.append(pr)
-
-        '''
-        prob_x = 0.0
-        for i, c in enumerate(self.CLASSES):
-            p_c = self.CLASSES_PROB_DISTRIBUTIONS[c]
-            prob_x += (p_c * prob[i])
-        prob = [x / prob_x for x in prob]
-        '''
-
-        prob_sum = sum(prob)
-        if prob_sum != 0.0:
-            prob = [x / prob_sum for x in prob]
-        else:
-            prob = [0.0 for x in prob]
-
-        pred_prob = {}
-        for i, c in enumerate(self.CLASSES):
-            pred_prob[c] = prob[i]
-
-        return pred_prob
-
-    def reset(self):
-        super()._reset_stats()
-        self.CLASSES_DISTRIBUTIONS = OrderedDict()
-        self.CLASSES_PROB_DISTRIBUTIONS = OrderedDict()
-        self.ATTRIBUTES_NAMES = []
-        self.ATTRIBUTES_VALUES_DISTRIBUTIONS = OrderedDict()
-        self.ATTRIBUTES_VALUES_PROB_DISTRIBUTIONS = OrderedDict()
-        self.__initialize_classes()
-        self.__initialize_attributes()
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import math
+import operator
+from collections import Counter, OrderedDict
+
+import numpy
+
+from classifier.classifier import SuperClassifier
+from data_structures.encoded_record import EncodedRecord
+from data_structures.sparse_record import SparseRecord
+from dictionary.tornado_dictionary import TornadoDic
+
+
+class NaiveBayes(SuperClassifier):
+    """This is the implementation of incremental naive bayes classifier for learning from data streams.
+    The counts are kept in one array of attributes x values x classes, so that training a record updates one count
+    per attribute. The probabilities are not kept; they are derived from the counts at test time, only for the values
+    of the record."""
+
+    LEARNER_NAME = TornadoDic.NAIVE_BAYES
+    LEARNER_TYPE = TornadoDic.TRAINABLE
+    LEARNER_CATEGORY = TornadoDic.NOM_CLASSIFIER
+    ENCODED_RECORDS = True
+
+    # THE NUMBER OF INSTANCES SCORED AT A TIME BY predict_proba_many()
+    BLOCK_SIZE = 4096
+
+    def __init__(self, labels, attributes, smoothing_parameter=1):
+
+        super().__init__(labels, attributes)
+
+        self.ATTRIBUTES_NAMES = []
+        self.ALPHA = smoothing_parameter
+
+        # THE CODE OF A CLASS, OR OF A VALUE, IS ITS INDEX IN THE LABELS, OR IN THE POSSIBLE VALUES OF ITS ATTRIBUTE
+        self.CLASSES_CODES = {}
+        self.VALUES_CODES = []
+
+        # THE COUNT OF (ATTRIBUTE a, VALUE v, CLASS c) IS AT ATTRIBUTES_VALUES_COUNTS[a, v, c], WHERE v IS THE CODE OF
+        # THE VALUE. THE ARRAY IS AS WIDE AS THE ATTRIBUTE HAVING THE MOST POSSIBLE VALUES.
+        self.CLASSES_COUNTS = None
+        self.ATTRIBUTES_VALUES_COUNTS = None
+        self.ATTRIBUTES_SIZES = None
+        self.ATTRIBUTES_ROWS = None
+
+        # FOR SPARSE RECORDS, THE COUNTS OF DEFAULT VALUES ARE DERIVED FROM THE COUNTS OF NON-DEFAULT VALUES
+        self.SPARSE_NON_DEFAULT_COUNTS = OrderedDict()
+        self.SPARSE_BASE_SCORES = OrderedDict()
+        self.NUMBERS_OF_POSSIBLE_VALUES = Counter()
+
+        self.__initialize_classes()
+        self.__initialize_attributes()
+
+    def __initialize_classes(self):
+        for code, c in enumerate(self.CLASSES):
+            self.CLASSES_CODES[c] = code
+            self.SPARSE_NON_DEFAULT_COUNTS[c] = {}
+            self.SPARSE_BASE_SCORES[c] = None
+        self.CLASSES_COUNTS = numpy.zeros(len(self.CLASSES), dtype=numpy.int64)
+
+    def __initialize_attributes(self):
+        for attr in self.ATTRIBUTES:
+            self.ATTRIBUTES_NAMES.append(attr.NAME)
+            self.VALUES_CODES.append({v: code for code, v in enumerate(attr.POSSIBLE_VALUES)})
+            self.NUMBERS_OF_POSSIBLE_VALUES[len(attr.POSSIBLE_VALUES)] += 1
+        sizes = [len(attr.POSSIBLE_VALUES) for attr in self.ATTRIBUTES]
+        self.ATTRIBUTES_VALUES_COUNTS = numpy.zeros((len(sizes), max(sizes, default=0), len(self.CLASSES)),
+                                                    dtype=numpy.int64)
+        self.ATTRIBUTES_SIZES = numpy.array(sizes, dtype=numpy.int64).reshape(len(sizes), 1)
+        # THE ROW OF (ATTRIBUTE a, VALUE v) IN THE ARRAY VIEWED AS (ATTRIBUTES x VALUES) x CLASSES IS ATTRIBUTES_ROWS[a] + v
+        self.ATTRIBUTES_ROWS = numpy.arange(len(sizes)) * self.ATTRIBUTES_VALUES_COUNTS.shape[1]
+
+    def train(self, instance):
+        self.NUMBER_OF_INSTANCES_OBSERVED += 1
+        if isinstance(instance, EncodedRecord):
+            self.__train_codes(instance[0:len(instance) - 1], instance[len(instance) - 1])
+        elif isinstance(instance, SparseRecord):
+            self.__set_sparse_attr_val_dist(instance)
+        else:
+            self.__train_codes(self.__get_values_codes(instance), self.CLASSES_CODES[instance[len(instance) - 1]])
+
+    def get_classes_dist(self):
+        return OrderedDict(zip(self.CLASSES, self.CLASSES_COUNTS.tolist()))
+
+    def __get_values_codes(self, x):
+        values_codes = self.VALUES_CODES
+        return [values_codes[attr_index][x[attr_index]] for attr_index in range(0, len(values_codes))]
+
+    def __get_rows(self, values_codes):
+        return self.ATTRIBUTES_ROWS + numpy.array(values_codes, dtype=numpy.intp)
+
+    def __train_codes(self, values_codes, y):
+        self.CLASSES_COUNTS[y] += 1
+        self.ATTRIBUTES_VALUES_COUNTS.reshape(-1, len(self.CLASSES))[self.__get_rows(values_codes), y] += 1
+
+    def __get_log_scores(self, values_codes):
+        """This function returns the log-score of each class, i.e. log P(c) plus the sum of log P(v|c) over the
+        attributes, where P(v|c) = (count(v, c) + 1) / (|values| + count(c)). Given the codes of a block of instances,
+        i.e. one row of codes per instance, it returns one row of log-scores per instance. The denominators do not
+        depend on the values, so their logarithms are summed once for the whole block."""
+        classes_counts = self.CLASSES_COUNTS
+        counts = self.ATTRIBUTES_VALUES_COUNTS.reshape(-1, len(classes_counts))[self.__get_rows(values_codes)]
+        with numpy.errstate(divide="ignore"):
+            log_priors = numpy.log(classes_counts / self.NUMBER_OF_INSTANCES_OBSERVED)
+        log_denominators = numpy.log(self.ATTRIBUTES_SIZES + classes_counts).sum(axis=0)
+        return numpy.log(counts + 1).sum(axis=-2) + (log_priors - log_denominators)
+
+    def __set_sparse_attr_val_dist(self, instance):
+        y = instance.LABEL
+        y_code = self.CLASSES_CODES[y]
+        self.CLASSES_COUNTS[y_code] += 1
+        non_default_counts = self.SPARSE_NON_DEFAULT_COUNTS[y]
+        for attr_index, value in instance.VALUES.items():
+            if value == instance.DEFAULTS[attr_index]:
+                continue
+            self.ATTRIBUTES_VALUES_COUNTS[attr_index, self.VALUES_CODES[attr_index][value], y_code] += 1
+            non_default_counts[attr_index] = non_default_counts.get(attr_index, 0) + 1
+        self.SPARSE_BASE_SCORES[y] = None
+
+    def __get_sparse_base_score(self, c, c_dist):
+        """The base score of a class is the log-probability of a record holding only default values given the
+        class. It is computed over the attributes having non-default values for the class, and it is cached
+        until the class is trained again."""
+        score = self.SPARSE_BASE_SCORES[c]
+        if score is None:
+            score = len(self.ATTRIBUTES_NAMES) * math.log(c_dist + 1)
+            for count in self.SPARSE_NON_DEFAULT_COUNTS[c].values():
+                score += math.log(c_dist - count + 1) - math.log(c_dist + 1)
+            for k, num_attributes in self.NUMBERS_OF_POSSIBLE_VALUES.items():
+                score -= num_attributes * math.log(k + c_dist)
+            self.SPARSE_BASE_SCORES[c] = score
+        return score
+
+    def __test_sparse(self, instance):
+        # THE COUNTS OF THE NON-DEFAULT VALUES OF THE INSTANCE ARE GATHERED ONCE, FOR ALL CLASSES
+        values_counts = []
+        for attr_index, value in instance.VALUES.items():
+            if value == instance.DEFAULTS[attr_index]:
+                continue
+            counts = self.ATTRIBUTES_VALUES_COUNTS[attr_index, self.VALUES_CODES[attr_index][value]].tolist()
+            values_counts.append((attr_index, counts))
+        classes_counts = self.CLASSES_COUNTS.tolist()
+        predictions = OrderedDict()
+        for c_code, c in enumerate(self.CLASSES):
+            c_dist = classes_counts[c_code]
+            if c_dist == 0:
+                predictions[c] = -math.inf
+                continue
+            non_default_counts = self.SPARSE_NON_DEFAULT_COUNTS[c]
+            score = math.log(c_dist / self.NUMBER_OF_INSTANCES_OBSERVED) + self.__get_sparse_base_score(c, c_dist)
+            # THE PROBABILITY OF THE DEFAULT VALUE IS REPLACED BY THE ONE OF THE GIVEN VALUE
+            for attr_index, counts in values_counts:
+                score += math.log(counts[c_code] + 1) - math.log(c_dist - non_default_counts.get(attr_index, 0) + 1)
+            predictions[c] = score
+        return max(predictions.items(), key=operator.itemgetter(1))[0]
+
+    def test(self, instance):
+        if self._IS_READY and isinstance(instance, EncodedRecord):
+            predicted_class = int(numpy.argmax(self.__get_log_scores(instance[0:len(instance) - 1])))
+            self.update_confusion_matrix(instance[len(instance) - 1], predicted_class)
+            return predicted_class
+        elif self._IS_READY and isinstance(instance, SparseRecord):
+            predicted_class = self.__test_sparse(instance)
+            self.update_confusion_matrix(instance.LABEL, predicted_class)
+            return predicted_class
+        elif self._IS_READY:
+            log_scores = self.__get_log_scores(self.__get_values_codes(instance))
+            predicted_class = self.CLASSES[int(numpy.argmax(log_scores))]
+            self.update_confusion_matrix(instance[len(instance) - 1], predicted_class)
+            return predicted_class
+        else:
+            print("Please train a Naive Bayes classifier first.")
+            exit()
+
+    def get_prediction_prob(self, X):
+        probabilities = self.predict_proba_many([X])[0].tolist()
+        return {c: probabilities[i] for i, c in enumerate(self.CLASSES)}
+
+    def predict_proba_many(self, X):
+        """This function returns the probabilities of the classes given a block of instances, i.e. records without
+        their labels, as an array of one row per instance and one column per class, in the order of the labels.
+        The instances are given by their values, by their codes, e.g. encoded records, or as an array of codes.
+        They are scored BLOCK_SIZE instances at a time, so that the counts gathered for a block fit in memory."""
+        probabilities = numpy.zeros((len(X), len(self.CLASSES)))
+        if self.NUMBER_OF_INSTANCES_OBSERVED == 0:
+            return probabilities
+        values_codes = self.VALUES_CODES
+        for start in range(0, len(X), self.BLOCK_SIZE):
+            block = X[start:start + self.BLOCK_SIZE]
+            if not isinstance(block, numpy.ndarray):
+                # A VALUE WHICH IS NOT A POSSIBLE VALUE OF ITS ATTRIBUTE IS TAKEN AS A CODE
+                block = [[values_codes[attr_index].get(x[attr_index], x[attr_index])
+                          for attr_index in range(0, len(values_codes))] for x in block]
+            probabilities[start:start + len(block)] = self._get_probabilities(self.__get_log_scores(block))
+        return probabilities
+
+    def reset(self):
+        super()._reset_stats()
+        self.ATTRIBUTES_NAMES = []
+        self.CLASSES_CODES = {}
+        self.VALUES_CODES = []
+        self.SPARSE_NON_DEFAULT_COUNTS = OrderedDict()
+        self.SPARSE_BASE_SCORES = OrderedDict()
+        self.NUMBERS_OF_POSSIBLE_VALUES = Counter()
+        self.__initialize_classes()
+        self.__initialize_attributes()
@@ -1,30 +1,165 @@
-import copy
-
-from dictionary.tornado_dictionary import TornadoDic
-from filters.attribute_handlers import Discretizer, NominalToNumericTransformer
-
-
-class AttributeScheme:
-
-    @staticmethod
-    def get_scheme(attributes):
-
-        numeric_attribute_scheme = []
-        nominal_attribute_scheme = []
-
-        for a in attributes:
-            if a.TYPE == TornadoDic.NUMERIC_ATTRIBUTE:
-                numeric_attribute_scheme.append(copy.copy(a))
-                # NOW LET'S MAKE A COPY FROM THE ATTRIBUTE OBJECT AND DISCRETIZE IT
-                discretized_a = copy.copy(a)
-                Discretizer.bin_attribute(discretized_a, 10)
-                nominal_attribute_scheme.append(discretized_a)
-            else:
-                nominal_attribute_scheme.append(copy.copy(a))
-                # NOW LET'S MAKE A COPY FROM THE ATTRIBUTE OBJECT AND MAKE IT NUMERIC
-                numeric_a = copy.copy(a)
-                NominalToNumericTransformer.convert_attribute_scheme(numeric_a)
-                numeric_attribute_scheme.append(numeric_a)
-
-        return {'numeric': numeric_attribute_scheme, 'nominal': nominal_attribute_scheme}
-
+import copy
+import random
+
+from data_structures.sparse_record import SparseRecord
+from dictionary.tornado_dictionary import TornadoDic
+from filters.attribute_handlers import Discretizer, NominalToNumericTransformer
+
+
+class AttributeScheme:
+
+    @staticmethod
+    def get_scheme(attributes, num_of_bins=10, sample=None):
+        """Numeric attributes are discretized into equal-width bins, or into equal-frequency bins if a sample of
+        records is given."""
+
+        numeric_attribute_scheme = []
+        nominal_attribute_scheme = []
+
+        for i, a in enumerate(attributes):
+            if a.TYPE == TornadoDic.NUMERIC_ATTRIBUTE:
+                numeric_attribute_scheme.append(copy.copy(a))
+                # NOW LET'S MAKE A COPY FROM THE ATTRIBUTE OBJECT AND DISCRETIZE IT
+                discretized_a = copy.copy(a)
+                if sample is None:
+                    Discretizer.bin_attribute(discretized_a, num_of_bins)
+                else:
+                    Discretizer.bin_attribute_by_frequency(discretized_a, num_of_bins, [r[i] for r in sample])
+                nominal_attribute_scheme.append(discretized_a)
+            else:
+                nominal_attribute_scheme.append(copy.copy(a))
+                # NOW LET'S MAKE A COPY FROM THE ATTRIBUTE OBJECT AND MAKE IT NUMERIC
+                numeric_a = copy.copy(a)
+                NominalToNumericTransformer.convert_attribute_scheme(numeric_a)
+                numeric_attribute_scheme.append(numeric_a)
+
+        return {'numeric': numeric_attribute_scheme, 'nominal': nominal_attribute_scheme}
+
+    @staticmethod
+    def get_online_scheme(attributes, num_of_bins=10, equal_frequency=False, sample_size=1000):
+        """This function returns the schemes of attributes without using their bounds, together with an
+        OnlineScheme under the 'online' key, which the tasks update record by record."""
+
+        numeric_attribute_scheme = []
+        nominal_attribute_scheme = []
+
+        for a in attributes:
+            if a.TYPE == TornadoDic.NUMERIC_ATTRIBUTE:
+                numeric_attribute_scheme.append(copy.copy(a))
+                nominal_attribute_scheme.append(copy.copy(a))
+            else:
+                nominal_attribute_scheme.append(copy.copy(a))
+                numeric_a = copy.copy(a)
+                NominalToNumericTransformer.convert_attribute_scheme(numeric_a)
+                numeric_attribute_scheme.append(numeric_a)
+
+        online_scheme = OnlineScheme(attributes, numeric_attribute_scheme, nominal_attribute_scheme,
+                                     num_of_bins, equal_frequency, sample_size)
+
+        return {'numeric': numeric_attribute_scheme, 'nominal': nominal_attribute_scheme, 'online': online_scheme}
+
+
+class OnlineScheme:
+    """This class maintains the numeric and nominal schemes of attributes while a stream is processed, so that no
+    pass over the whole stream is needed beforehand. The bounds of numeric attributes are the running minimum and
+    maximum, starting from [0, 0] as ARFFReader.read() does. Numeric attributes are discretized into num_of_bins bins
+    whose labels never change, so that learners can keep their statistics, while the upper bounds of the bins are
+    re-computed as the stream goes on:
+        - equal-width bins cover a range which is doubled, at least, whenever a value falls outside of it,
+          so there are O(log(final range / first range)) re-binnings;
+        - equal-frequency bins are re-computed from a bounded reservoir sample of each attribute whenever the
+          number of records seen doubles, and their last upper bound is infinite.
+    A re-binning changes what the bins stand for, and learners see it as a change in the stream."""
+
+    def __init__(self, attributes, numeric_attribute_scheme, nominal_attribute_scheme, num_of_bins=10,
+                 equal_frequency=False, sample_size=1000, random_seed=1):
+        self.ATTRIBUTES = attributes
+        self.NUMERIC_ATTRIBUTE_SCHEME = numeric_attribute_scheme
+        self.NOMINAL_ATTRIBUTE_SCHEME = nominal_attribute_scheme
+        self.NUM_OF_BINS = num_of_bins
+        self.EQUAL_FREQUENCY = equal_frequency
+        self.SAMPLE_SIZE = sample_size
+
+        self.NUMERIC_INDEXES = [i for i in range(0, len(attributes))
+                                if attributes[i].TYPE == TornadoDic.NUMERIC_ATTRIBUTE]
+        self.BINS_RANGES = {i: [0, 0] for i in self.NUMERIC_INDEXES}
+        self.SAMPLES = {i: [] for i in self.NUMERIC_INDEXES}
+        self.NUMBER_OF_RECORDS_SEEN = 0
+        self.NEXT_RE_BINNING = 1
+        # A PRIVATE GENERATOR KEEPS THE RESERVOIR SAMPLING FROM CHANGING THE RANDOM STATE OF LEARNERS AND DETECTORS
+        self.RANDOM = random.Random(random_seed)
+
+        for i in self.NUMERIC_INDEXES:
+            self.NUMERIC_ATTRIBUTE_SCHEME[i].set_bounds_values(0, 0)
+            self.NOMINAL_ATTRIBUTE_SCHEME[i].set_type(TornadoDic.NOMINAL_ATTRIBUTE)
+            self.NOMINAL_ATTRIBUTE_SCHEME[i].set_possible_values(["bin_" + str(k) for k in range(1, num_of_bins + 1)])
+            self.__set_upper_bounds(i)
+
+    def update(self, record):
+        """This function updates the schemes with a record. It returns True if any bound has changed, in which case
+        the transformation plans must be compiled again."""
+        self.NUMBER_OF_RECORDS_SEEN += 1
+        changed = False
+        # ONLY THE EXPLICIT VALUES OF A SPARSE RECORD CAN MOVE THE BOUNDS, SINCE THEY START FROM [0, 0]. THE RESERVOIRS,
+        # HOWEVER, SAMPLE ONE VALUE OF EACH ATTRIBUTE PER RECORD, SO THEY ARE ALSO GIVEN THE OMITTED VALUES.
+        if isinstance(record, SparseRecord) and self.EQUAL_FREQUENCY is False:
+            values = [(i, x) for i, x in record.VALUES.items() if i in self.BINS_RANGES]
+        else:
+            values = [(i, record[i]) for i in self.NUMERIC_INDEXES]
+
+        for i, x in values:
+            scheme = self.NUMERIC_ATTRIBUTE_SCHEME[i]
+            if x < scheme.MINIMUM_VALUE:
+                scheme.set_bounds_values(x, scheme.MAXIMUM_VALUE)
+                changed = True
+            elif x > scheme.MAXIMUM_VALUE:
+                scheme.set_bounds_values(scheme.MINIMUM_VALUE, x)
+                changed = True
+            if self.EQUAL_FREQUENCY is True:
+                self.__sample(i, x)
+            elif self.__grow_bins_range(i, x) is True:
+                self.__set_upper_bounds(i)
+                changed = True
+
+        if self.EQUAL_FREQUENCY is True and self.NUMBER_OF_RECORDS_SEEN == self.NEXT_RE_BINNING:
+            self.NEXT_RE_BINNING *= 2
+            for i in self.NUMERIC_INDEXES:
+                self.__set_upper_bounds(i)
+            changed = True
+        return changed
+
+    def __grow_bins_range(self, i, x):
+        lower_bound, upper_bound = self.BINS_RANGES[i]
+        if lower_bound <= x <= upper_bound:
+            return False
+        width = upper_bound - lower_bound
+        if x > upper_bound:
+            upper_bound = max(x, lower_bound + 2 * width)
+        else:
+            lower_bound = min(x, upper_bound - 2 * width)
+        self.BINS_RANGES[i] = [lower_bound, upper_bound]
+        return True
+
+    def __sample(self, i, x):
+        sample = self.SAMPLES[i]
+        if len(sample) < self.SAMPLE_SIZE:
+            sample.append(x)
+        else:
+            # RESERVOIR SAMPLING, WHERE EACH VALUE SEEN SO FAR IS IN THE SAMPLE WITH THE SAME PROBABILITY
+            j = self.RANDOM.randrange(0, self.NUMBER_OF_RECORDS_SEEN)
+            if j < self.SAMPLE_SIZE:
+                sample[j] = x
+
+    def __set_upper_bounds(self, i):
+        n = self.NUM_OF_BINS
+        if self.EQUAL_FREQUENCY is True:
+            sample = sorted(self.SAMPLES[i])
+            upper_bounds = []
+            for k in range(1, n):
+                upper_bounds.append(sample[(k * len(sample)) // n] if len(sample) != 0 else float("inf"))
+            upper_bounds.append(float("inf"))
+        else:
+            lower_bound, upper_bound = self.BINS_RANGES[i]
+            w = (upper_bound - lower_bound) / n
+            upper_bounds = [lower_bound + (k + 1) * w for k in range(0, n - 1)] + [upper_bound]
+        self.NOMINAL_ATTRIBUTE_SCHEME[i].UPPER_BOUNDS = upper_bounds
@@ -0,0 +1,43 @@
+from data_structures.sparse_record import SparseRecord
+from dictionary.tornado_dictionary import TornadoDic
+
+
+class EncodedRecord(list):
+    """This class keeps a record whose nominal values and label are given by their codes, i.e. their indexes in
+    the possible values of attributes and in the labels, while numeric values are kept as floats."""
+
+    def __copy__(self):
+        return EncodedRecord(self)
+
+
+class RecordEncoder:
+    """This class encodes records into EncodedRecord objects, and decodes them back. A value which is not in the
+    code table of its attribute, e.g. the missing value "?", is kept as it is."""
+
+    def __init__(self, labels, attributes):
+        self.LABELS = labels
+        self.LABELS_CODES = {label: code for code, label in enumerate(labels)}
+        self.ATTRIBUTES = attributes
+        self.NOMINAL_INDEXES = [i for i in range(0, len(attributes))
+                                if attributes[i].TYPE == TornadoDic.NOMINAL_ATTRIBUTE]
+
+    def encode(self, record):
+        # SPARSE RECORDS ARE ALREADY COMPACT, SO THEY ARE NOT ENCODED
+        if isinstance(record, SparseRecord):
+            return record
+        r = EncodedRecord(record)
+        for i in self.NOMINAL_INDEXES:
+            r[i] = self.ATTRIBUTES[i].CODES.get(r[i], r[i])
+        r[len(r) - 1] = self.LABELS_CODES.get(r[len(r) - 1], r[len(r) - 1])
+        return r
+
+    def decode(self, record):
+        if not isinstance(record, EncodedRecord):
+            return record
+        r = list(record)
+        for i in self.NOMINAL_INDEXES:
+            if isinstance(r[i], int):
+                r[i] = self.ATTRIBUTES[i].POSSIBLE_VALUES[r[i]]
+        if isinstance(r[len(r) - 1], int):
+            r[len(r) - 1] = self.LABELS[r[len(r) - 1]]
+        return r
@@ -0,0 +1,69 @@
+import numpy
+
+
+class OutcomeStream:
+    """This class keeps the prediction outcomes of a learner along a stream, one bit per record telling whether the
+    learner is tested on the record, and one bit telling whether its prediction is correct. A learner is not tested on
+    rubbish records, nor while it is not ready. START is the number of records before the first one of the outcome
+    stream, e.g. the location of the reset which the outcome stream starts after. The bits are appended to byte arrays,
+    and they are packed, eight per byte, by pack()."""
+
+    def __init__(self, start=0):
+        self.START = start
+        self.NUM_RECORDS = 0
+        self.TESTED = bytearray()
+        self.CORRECT = bytearray()
+
+    def append(self, tested, correct=False):
+        self.TESTED.append(tested)
+        self.CORRECT.append(correct)
+        self.NUM_RECORDS += 1
+
+    def pack(self):
+        if isinstance(self.TESTED, bytearray):
+            self.TESTED = numpy.packbits(numpy.frombuffer(self.TESTED, dtype=numpy.uint8))
+            self.CORRECT = numpy.packbits(numpy.frombuffer(self.CORRECT, dtype=numpy.uint8))
+
+    def get_end(self):
+        return self.START + self.NUM_RECORDS
+
+    def get_outcomes(self):
+        """This function returns the positions of the records on which the learner is tested, i.e. their instance
+        counters, together with the outcomes of its predictions, as lists."""
+        self.pack()
+        tested = numpy.unpackbits(self.TESTED, count=self.NUM_RECORDS).astype(bool)
+        correct = numpy.unpackbits(self.CORRECT, count=self.NUM_RECORDS).astype(bool)
+        positions = numpy.flatnonzero(tested) + self.START + 1
+        return positions.tolist(), correct[tested].tolist()
+
+
+class OutcomeRecording:
+    """This class keeps the outcome stream of a learner, and the outcome streams of fresh copies of it started after
+    each reset point, in one .npz file."""
+
+    def __init__(self, main, resets=None):
+        self.MAIN = main
+        self.RESETS = resets if resets is not None else []
+
+    def save(self, file_path):
+        streams = [self.MAIN] + self.RESETS
+        for stream in streams:
+            stream.pack()
+        numpy.savez(file_path,
+                    starts=numpy.array([s.START for s in streams], dtype=numpy.int64),
+                    num_records=numpy.array([s.NUM_RECORDS for s in streams], dtype=numpy.int64),
+                    offsets=numpy.cumsum([0] + [len(s.TESTED) for s in streams]).astype(numpy.int64),
+                    tested=numpy.concatenate([s.TESTED for s in streams]),
+                    correct=numpy.concatenate([s.CORRECT for s in streams]))
+
+    @staticmethod
+    def load(file_path):
+        arrays = numpy.load(file_path)
+        streams = []
+        for i in range(0, len(arrays['starts'])):
+            stream = OutcomeStream(int(arrays['starts'][i]))
+            stream.NUM_RECORDS = int(arrays['num_records'][i])
+            stream.TESTED = arrays['tested'][arrays['offsets'][i]:arrays['offsets'][i + 1]]
+            stream.CORRECT = arrays['correct'][arrays['offsets'][i]:arrays['offsets'][i + 1]]
+            streams.append(stream)
+        return OutcomeRecording(streams[0], streams[1:])
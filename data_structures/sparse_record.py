@@ -0,0 +1,66 @@
+from dictionary.tornado_dictionary import TornadoDic
+
+
+class SparseRecord:
+    """This class keeps a record of a sparse .arff file, i.e. {index value, ...}, as a dictionary of its explicit
+    values by attribute index. Any omitted value is given by DEFAULTS, which is shared by all the records of a stream.
+    A sparse record can be indexed and sliced like a dense one, where the last element is the label."""
+
+    __slots__ = ['VALUES', 'DEFAULTS', 'LABEL']
+
+    def __init__(self, values, defaults, label):
+        self.VALUES = values
+        self.DEFAULTS = defaults
+        self.LABEL = label
+
+    @staticmethod
+    def get_default_values(attributes):
+        """An omitted numeric value is zero, and an omitted nominal value is the first possible value."""
+        defaults = []
+        for attribute in attributes:
+            if attribute.TYPE == TornadoDic.NUMERIC_ATTRIBUTE:
+                defaults.append(0.0)
+            else:
+                defaults.append(attribute.POSSIBLE_VALUES[0])
+        return defaults
+
+    def to_dense(self):
+        elements = list(self.DEFAULTS)
+        for index, value in self.VALUES.items():
+            elements[index] = value
+        elements.append(self.LABEL)
+        return elements
+
+    def __len__(self):
+        return len(self.DEFAULTS) + 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_dense()[index]
+        num_attributes = len(self.DEFAULTS)
+        if index < 0:
+            index += num_attributes + 1
+        if index == num_attributes:
+            return self.LABEL
+        if not 0 <= index < num_attributes:
+            raise IndexError("The attribute index is out of range.")
+        return self.VALUES.get(index, self.DEFAULTS[index])
+
+    def __iter__(self):
+        return iter(self.to_dense())
+
+    def __contains__(self, value):
+        return value == self.LABEL or value in self.VALUES.values()
+
+    def __copy__(self):
+        return SparseRecord(dict(self.VALUES), self.DEFAULTS, self.LABEL)
+
+    def __eq__(self, other):
+        if isinstance(other, SparseRecord):
+            return self.to_dense() == other.to_dense()
+        return self.to_dense() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "SparseRecord(" + repr(self.VALUES) + ", " + repr(self.LABEL) + ")"
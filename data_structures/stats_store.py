@@ -0,0 +1,133 @@
+import numpy
+
+
+class StatsStore:
+    """This class keeps the statistics of pairs of (classifier, detector), record by record, in NumPy structured
+    arrays instead of one Python list per pair per record. The arrays of a pair are grown geometrically. If
+    downsampling is k, only every k-th point and all the points at which a drift is located are kept, while the
+    latest statistics of every pair are always available. The located drift points are kept as record positions."""
+
+    DTYPE = numpy.dtype([('position', numpy.int64),
+                         ('error_rate', numpy.float64), ('learner_memory', numpy.float64),
+                         ('learner_runtime', numpy.float64),
+                         ('delay', numpy.int64), ('tp_loc', numpy.int64), ('tp', numpy.int64),
+                         ('fp', numpy.int64), ('fn', numpy.int64),
+                         ('detector_memory', numpy.float64), ('detector_runtime', numpy.float64)])
+
+    LEARNER_FIELDS = ['position', 'error_rate', 'learner_memory', 'learner_runtime']
+    DETECTOR_FIELDS = ['position', 'delay', 'tp_loc', 'tp', 'fp', 'fn', 'detector_memory', 'detector_runtime']
+
+    def __init__(self, num_pairs, downsampling=1, capacity=1024):
+        if downsampling < 1:
+            raise ValueError("The downsampling factor must be at least 1.")
+        self.DOWNSAMPLING = downsampling
+        self.CAPACITY = capacity
+        self.NUM_POINTS = [0] * num_pairs
+        self.SIZES = [0] * num_pairs
+        self.STATS = [numpy.zeros(capacity, dtype=StatsStore.DTYPE) for _ in range(0, num_pairs)]
+        self.DRIFT_POINTS = [[] for _ in range(0, num_pairs)]
+        self.LATEST_LEARNER_STATS = [[0, 0, 0] for _ in range(0, num_pairs)]
+        self.LATEST_DETECTOR_STATS = [[0, [0, 0], 0, 0, 0, 0] for _ in range(0, num_pairs)]
+
+    def append(self, index, learner_stats, detector_stats, drift=False):
+        """The statistics are given in the form of [error-rate, memory, runtime] for the classifier, and
+        [delay, [tp_loc, tp], fp, fn, memory, runtime] for the detector."""
+        position = self.NUM_POINTS[index]
+        self.NUM_POINTS[index] = position + 1
+        self.LATEST_LEARNER_STATS[index] = learner_stats
+        self.LATEST_DETECTOR_STATS[index] = detector_stats
+        if drift is True:
+            self.DRIFT_POINTS[index].append(position)
+        elif position % self.DOWNSAMPLING != 0:
+            return
+        size = self.SIZES[index]
+        if size == len(self.STATS[index]):
+            self.__grow(index)
+        delay, [tp_loc, tp], fp, fn, detector_memory, detector_runtime = detector_stats
+        self.STATS[index][size] = (position, learner_stats[0], learner_stats[1], learner_stats[2],
+                                   delay, tp_loc, tp, fp, fn, detector_memory, detector_runtime)
+        self.SIZES[index] = size + 1
+
+    def __grow(self, index):
+        stats = numpy.zeros(max(2 * len(self.STATS[index]), 1), dtype=StatsStore.DTYPE)
+        stats[:self.SIZES[index]] = self.STATS[index][:self.SIZES[index]]
+        self.STATS[index] = stats
+
+    def get_latest_learner_stats(self, index):
+        return self.LATEST_LEARNER_STATS[index]
+
+    def get_latest_detector_stats(self, index):
+        return self.LATEST_DETECTOR_STATS[index]
+
+    def get_num_points(self, index=0):
+        return self.NUM_POINTS[index]
+
+    def get_stats(self, index):
+        """This function returns a view of the kept points of a pair."""
+        return self.STATS[index][:self.SIZES[index]]
+
+    def get_positions(self, index):
+        return self.get_stats(index)['position']
+
+    def get_learner_stats(self, index):
+        return self.get_stats(index)[StatsStore.LEARNER_FIELDS]
+
+    def get_detector_stats(self, index):
+        return self.get_stats(index)[StatsStore.DETECTOR_FIELDS]
+
+    def get_learner_rows(self, index):
+        """This function returns the kept points of a pair in the form in which they are given to append(), i.e.
+        [error-rate, memory, runtime], e.g. to archive them."""
+        stats = self.get_stats(index)
+        return [[error_rate, memory, runtime] for error_rate, memory, runtime in
+                zip(*[stats[field].tolist() for field in StatsStore.LEARNER_FIELDS[1:]])]
+
+    def get_detector_rows(self, index):
+        """This function returns the kept points of a pair in the form in which they are given to append(), i.e.
+        [delay, [tp_loc, tp], fp, fn, memory, runtime], e.g. to archive them."""
+        stats = self.get_stats(index)
+        return [[delay, [tp_loc, tp], fp, fn, memory, runtime] for delay, tp_loc, tp, fp, fn, memory, runtime in
+                zip(*[stats[field].tolist() for field in StatsStore.DETECTOR_FIELDS[1:]])]
+
+    def get_drift_points(self, index):
+        return numpy.array(self.DRIFT_POINTS[index], dtype=numpy.int64)
+
+    def trim(self):
+        """This function releases the unused capacity of the arrays, e.g. before sending the store to another
+        process."""
+        for index in range(0, len(self.STATS)):
+            self.STATS[index] = self.STATS[index][:self.SIZES[index]].copy()
+
+    def get_state(self):
+        """The state is the part of the store which is not only appended to, as opposed to its series."""
+        return {"downsampling": self.DOWNSAMPLING,
+                "num_points": self.NUM_POINTS,
+                "latest_learner_stats": self.LATEST_LEARNER_STATS,
+                "latest_detector_stats": self.LATEST_DETECTOR_STATS}
+
+    def get_series(self, indexes=None):
+        series = {}
+        for index in indexes if indexes is not None else range(0, len(self.STATS)):
+            series["stats_" + str(index)] = self.get_stats(index)
+            series["drift_points_" + str(index)] = self.DRIFT_POINTS[index]
+        return series
+
+    def restore(self, state, series):
+        self.DOWNSAMPLING = state["downsampling"]
+        self.NUM_POINTS = state["num_points"]
+        self.LATEST_LEARNER_STATS = state["latest_learner_stats"]
+        self.LATEST_DETECTOR_STATS = state["latest_detector_stats"]
+        for index in range(0, len(self.STATS)):
+            self.STATS[index] = series["stats_" + str(index)].copy()
+            self.SIZES[index] = len(self.STATS[index])
+            self.DRIFT_POINTS[index] = series["drift_points_" + str(index)]
+
+    def copy_pairs(self, other, indexes):
+        """This function takes the statistics of the given pairs from another store, e.g. the one of a worker."""
+        for index in indexes:
+            self.NUM_POINTS[index] = other.NUM_POINTS[index]
+            self.SIZES[index] = other.SIZES[index]
+            self.STATS[index] = other.STATS[index]
+            self.DRIFT_POINTS[index] = other.DRIFT_POINTS[index]
+            self.LATEST_LEARNER_STATS[index] = other.LATEST_LEARNER_STATS[index]
+            self.LATEST_DETECTOR_STATS[index] = other.LATEST_DETECTOR_STATS[index]
@@ -1,11 +1,11 @@
-from drift_detection.adwin import ADWINChangeDetector
-from drift_detection.cusum import CUSUM
-from drift_detection.ddm import DDM
-from drift_detection.eddm import EDDM
-from drift_detection.fhddm import FHDDM
-from drift_detection.fhddms import FHDDMS
-from drift_detection.hddm_a import HDDM_A_test
-from drift_detection.hddm_w import HDDM_W_test
-from drift_detection.rddm import RDDM
-from drift_detection.page_hinkley import PH
-from drift_detection.seq_drift2 import SeqDrift2ChangeDetector
+from drift_detection.adwin import ADWINChangeDetector
+from drift_detection.cusum import CUSUM
+from drift_detection.ddm import DDM
+from drift_detection.eddm import EDDM
+from drift_detection.fhddm import FHDDM
+from drift_detection.fhddms import FHDDMS
+from drift_detection.hddm_a import HDDM_A_test
+from drift_detection.hddm_w import HDDM_W_test
+from drift_detection.rddm import RDDM
+from drift_detection.page_hinkley import PH
+from drift_detection.seq_drift2 import SeqDrift2ChangeDetector
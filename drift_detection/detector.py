@@ -1,34 +1,55 @@
-"""
-The Tornado Framework
-By Ali Pesaranghader
-University of Ottawa, Ontario, Canada
-E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
-"""
-
-import time
-
-
-class SuperDetector:
-    """A drift detector method inherits this super detector class!"""
-
-    def __init__(self):
-        self.RUNTIME = 0
-        self.TOTAL_RUNTIME = 0
-
-    def detect(self, pr):
-        t1 = time.perf_counter()
-        warning_status, drift_status = self.run(pr)
-        t2 = time.perf_counter()
-        delta_t = (t2 - t1) * 1000  # in milliseconds
-        self.RUNTIME += delta_t
-        self.TOTAL_RUNTIME += delta_t
-        return warning_status, drift_status
-
-    def run(self, pr):
-        return False, False
-
-    def reset(self):
-        self.RUNTIME = 0
-
-    def get_settings(self):
-        raise NotImplementedError('THE RESET FUNCTION HAS NOT BEEN DEFINED IN THE CHILD')
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import time
+
+from evaluators.memory_estimator import MemoryEstimator
+
+
+class SuperDetector:
+    """A drift detector method inherits this super detector class!"""
+
+    def __init__(self):
+        self.RUNTIME = 0
+        self.TOTAL_RUNTIME = 0
+        # THE SIZE OF THE PARTS OF A DETECTOR WHICH DO NOT GROW, WHICH IS MEASURED BY THE FIRST CALL OF
+        # memory_footprint() AND IS KEPT BY ITS RESETS AND ITS COPIES
+        self._FIXED_FOOTPRINT = None
+
+    def detect(self, pr):
+        t1 = time.perf_counter()
+        warning_status, drift_status = self.run(pr)
+        t2 = time.perf_counter()
+        delta_t = (t2 - t1) * 1000  # in milliseconds
+        self.RUNTIME += delta_t
+        self.TOTAL_RUNTIME += delta_t
+        return warning_status, drift_status
+
+    def run(self, pr):
+        return False, False
+
+    def reset(self):
+        self.RUNTIME = 0
+
+    def memory_footprint(self):
+        """This function returns the memory usage of the detector in bytes, in O(1) time. The size of the parts
+        which do not grow is measured once by asizeof.asizeof(), on the first call, and the size of the parts
+        which grow, e.g. a sliding window, is calculated by _get_variable_footprint() from the counters of the
+        detector."""
+        if self._FIXED_FOOTPRINT is None:
+            self._FIXED_FOOTPRINT = MemoryEstimator.get_fixed_footprint(self)
+        return self._FIXED_FOOTPRINT + self._get_variable_footprint()
+
+    def _get_variable_footprint(self):
+        return 0
+
+    def set_random_generator(self, random_generator):
+        # A DETECTOR WHICH DRAWS RANDOM NUMBERS OVERRIDES IT, SO THAT IT DOES NOT SHARE THE GLOBAL GENERATOR
+        pass
+
+    def get_settings(self):
+        raise NotImplementedError('THE RESET FUNCTION HAS NOT BEEN DEFINED IN THE CHILD')
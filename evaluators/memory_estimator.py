@@ -0,0 +1,60 @@
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import sys
+
+from pympler import asizeof
+
+
+class MemoryEstimator:
+    """This class estimates the size of an object in bytes by sys.getsizeof(), without walking the whole graph of
+    objects as asizeof.asizeof() does. The object, its dictionaries, lists, tuples, and sets, and the numbers they keep
+    are counted. The keys of dictionaries, strings, and any other object it refers to, e.g. classes, attributes, or
+    other nodes of a tree, are considered as shared, so they are not counted."""
+
+    # THE DEPTH TO WHICH asizeof.asizeof() WALKS THE GRAPH OF OBJECTS, BOTH IN THE AUDIT MODE AND WHEN THE PARTS OF A
+    # CLASSIFIER OR A DETECTOR WHICH DO NOT GROW ARE MEASURED, SO THAT THE TWO AGREE
+    ASIZEOF_LIMIT = 20
+
+    @staticmethod
+    def get_memory_usage(obj, audit=False, limit=ASIZEOF_LIMIT):
+        """This function returns the memory usage of a classifier or a detector in bytes, as it is given by its
+        memory_footprint(). In the audit mode, the whole graph of objects is walked by asizeof.asizeof() instead."""
+        if audit is True:
+            return asizeof.asizeof(obj, limit=limit)
+        return obj.memory_footprint()
+
+    @staticmethod
+    def get_fixed_footprint(obj):
+        """This function returns the size of the parts of a classifier or a detector which do not grow."""
+        return asizeof.asizeof(obj, limit=MemoryEstimator.ASIZEOF_LIMIT) - obj._get_variable_footprint()
+
+    @staticmethod
+    def get_size(obj):
+        size = sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            for value in obj.values():
+                size += MemoryEstimator.__get_value_size(value)
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            for value in obj:
+                size += MemoryEstimator.__get_value_size(value)
+        elif hasattr(obj, "__dict__"):
+            size += MemoryEstimator.get_size(obj.__dict__)
+        return size
+
+    @staticmethod
+    def __get_value_size(value):
+        if isinstance(value, (dict, list, tuple, set, frozenset)):
+            return MemoryEstimator.get_size(value)
+        if value is None or isinstance(value, bool):
+            return 0
+        if isinstance(value, int):
+            # SMALL INTEGERS ARE CACHED BY PYTHON, SO THEY ARE SHARED
+            return 0 if -5 <= value <= 256 else sys.getsizeof(value)
+        if isinstance(value, float):
+            return sys.getsizeof(value)
+        return 0
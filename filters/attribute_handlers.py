@@ -1,82 +1,257 @@
-"""
-The Tornado Framework
-By Ali Pesaranghader
-University of Ottawa, Ontario, Canada
-E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
-"""
-
-import operator
-from collections import OrderedDict
-
-from dictionary.tornado_dictionary import TornadoDic
-
-
-class NominalToNumericTransformer:
-    """This is a nominal to numeric scheme transformer."""
-
-    @staticmethod
-    def convert_attribute_scheme(attribute):
-        possible_values = OrderedDict()
-        for i in range(1, len(attribute.POSSIBLE_VALUES) + 1):
-            # if attribute.POSSIBLE_VALUES[i - 1].isdigit() and len(attribute.POSSIBLE_VALUES) == 2:
-            #    possible_values[attribute.POSSIBLE_VALUES[i - 1]] = float(attribute.POSSIBLE_VALUES[i - 1])
-            #else:
-            possible_values[attribute.POSSIBLE_VALUES[i - 1]] = i
-        attribute.TYPE = TornadoDic.NUMERIC_ATTRIBUTE
-        attribute.POSSIBLE_VALUES = possible_values
-        attribute.MAXIMUM_VALUE = max(possible_values.items(), key=operator.itemgetter(1))[1]
-        attribute.MINIMUM_VALUE = min(possible_values.items(), key=operator.itemgetter(1))[1]
-
-    @staticmethod
-    def map_attribute_value(x_index, attribute_scheme):
-        return attribute_scheme.POSSIBLE_VALUES[x_index]
-
-
-class NumericToNominalTransformer:
-    """This is a numeric to nominal scheme transformer."""
-
-    @staticmethod
-    def convert_attribute_scheme(attribute):
-        possible_values = []
-        for v in attribute.POSSIBLE_VALUES:
-            possible_values.append(str(v))
-        attribute.TYPE = TornadoDic.NOMINAL_ATTRIBUTE
-        attribute.POSSIBLE_VALUES = possible_values
-
-    @staticmethod
-    def map_attribute_value(x):
-        return str(x)
-
-
-class Normalizer:
-    """The min-max normalizer."""
-
-    @staticmethod
-    def normalize(record, scheme):
-        for i in range(0, len(record)):
-            record[i] = (record[i] - scheme[i].MINIMUM_VALUE) / (scheme[i].MAXIMUM_VALUE - scheme[i].MINIMUM_VALUE)
-        return record
-
-
-class Discretizer:
-    """The bin-based discretizer."""
-
-    @staticmethod
-    def bin_attribute(attribute, num_of_bins):
-        bins = []
-        w = (attribute.MAXIMUM_VALUE - attribute.MINIMUM_VALUE) / num_of_bins
-        for k in range(0, num_of_bins):
-            lower_bound = round(attribute.MINIMUM_VALUE + (k * w), 10)
-            upper_bound = round(attribute.MINIMUM_VALUE + ((k + 1) * w), 10)
-            bins.append(str(lower_bound) + '..' + str(upper_bound))
-        attribute.TYPE = TornadoDic.NOMINAL_ATTRIBUTE
-        attribute.set_possible_values(bins)
-
-    @staticmethod
-    def find_bin(x, attribute):
-        for v in attribute.POSSIBLE_VALUES:
-            upper_bound = float(v.split("..")[1])
-            if x <= upper_bound:
-                x = v
-                break
-        return x
+"""
+The Tornado Framework
+By Ali Pesaranghader
+University of Ottawa, Ontario, Canada
+E-mail: apesaran -at- uottawa -dot- ca / alipsgh -at- gmail -dot- com
+"""
+
+import bisect
+import operator
+from collections import OrderedDict
+
+import numpy
+
+from data_structures.encoded_record import EncodedRecord
+from data_structures.sparse_record import SparseRecord
+from dictionary.tornado_dictionary import TornadoDic
+
+
+class NominalToNumericTransformer:
+    """This is a nominal to numeric scheme transformer."""
+
+    @staticmethod
+    def convert_attribute_scheme(attribute):
+        possible_values = OrderedDict()
+        for i in range(1, len(attribute.POSSIBLE_VALUES) + 1):
+            # if attribute.POSSIBLE_VALUES[i - 1].isdigit() and len(attribute.POSSIBLE_VALUES) == 2:
+            #    possible_values[attribute.POSSIBLE_VALUES[i - 1]] = float(attribute.POSSIBLE_VALUES[i - 1])
+            #else:
+            possible_values[attribute.POSSIBLE_VALUES[i - 1]] = i
+        attribute.TYPE = TornadoDic.NUMERIC_ATTRIBUTE
+        attribute.POSSIBLE_VALUES = possible_values
+        attribute.MAXIMUM_VALUE = max(possible_values.items(), key=operator.itemgetter(1))[1]
+        attribute.MINIMUM_VALUE = min(possible_values.items(), key=operator.itemgetter(1))[1]
+
+    @staticmethod
+    def map_attribute_value(x_index, attribute_scheme):
+        return attribute_scheme.POSSIBLE_VALUES[x_index]
+
+    @staticmethod
+    def map_attribute_code(x_code, attribute_scheme):
+        # THE POSSIBLE VALUES ARE MAPPED TO 1, 2, ..., IN THE ORDER OF THEIR CODES
+        return x_code + 1
+
+
+class NumericToNominalTransformer:
+    """This is a numeric to nominal scheme transformer."""
+
+    @staticmethod
+    def convert_attribute_scheme(attribute):
+        possible_values = []
+        for v in attribute.POSSIBLE_VALUES:
+            possible_values.append(str(v))
+        attribute.TYPE = TornadoDic.NOMINAL_ATTRIBUTE
+        attribute.POSSIBLE_VALUES = possible_values
+
+    @staticmethod
+    def map_attribute_value(x):
+        return str(x)
+
+
+class Normalizer:
+    """The min-max normalizer."""
+
+    @staticmethod
+    def normalize(record, scheme):
+        for i in range(0, len(record)):
+            record[i] = (record[i] - scheme[i].MINIMUM_VALUE) / (scheme[i].MAXIMUM_VALUE - scheme[i].MINIMUM_VALUE)
+        return record
+
+
+class Discretizer:
+    """The bin-based discretizer. The float upper bounds of bins are kept with the attribute, so that a value is
+    located by a binary search, or a whole column of values by a vectorized one, instead of parsing bin labels."""
+
+    @staticmethod
+    def bin_attribute(attribute, num_of_bins):
+        bins = []
+        upper_bounds = []
+        w = (attribute.MAXIMUM_VALUE - attribute.MINIMUM_VALUE) / num_of_bins
+        for k in range(0, num_of_bins):
+            lower_bound = round(attribute.MINIMUM_VALUE + (k * w), 10)
+            upper_bound = round(attribute.MINIMUM_VALUE + ((k + 1) * w), 10)
+            bins.append(str(lower_bound) + '..' + str(upper_bound))
+            upper_bounds.append(upper_bound)
+        attribute.TYPE = TornadoDic.NOMINAL_ATTRIBUTE
+        attribute.set_possible_values(bins)
+        attribute.UPPER_BOUNDS = upper_bounds
+
+    @staticmethod
+    def bin_attribute_by_frequency(attribute, num_of_bins, sample):
+        """This function makes bins holding about the same number of values of the sample. Bins whose bounds
+        would be equal, e.g. because of a frequent value, are merged, so there may be fewer than num_of_bins bins.
+        The first and the last bins are extended to the bounds of the attribute."""
+        sample = numpy.sort(numpy.asarray(sample, dtype=numpy.float64))
+        edges = [attribute.MINIMUM_VALUE]
+        if len(sample) != 0:
+            for k in range(1, num_of_bins):
+                edges.append(float(sample[min(len(sample) - 1, (k * len(sample)) // num_of_bins)]))
+        edges.append(attribute.MAXIMUM_VALUE)
+        bins = []
+        upper_bounds = []
+        lower_bound = round(edges[0], 10)
+        for edge in edges[1:]:
+            upper_bound = round(edge, 10)
+            if upper_bound <= lower_bound and len(bins) != 0:
+                continue
+            bins.append(str(lower_bound) + '..' + str(upper_bound))
+            upper_bounds.append(upper_bound)
+            lower_bound = upper_bound
+        attribute.TYPE = TornadoDic.NOMINAL_ATTRIBUTE
+        attribute.set_possible_values(bins)
+        attribute.UPPER_BOUNDS = upper_bounds
+
+    @staticmethod
+    def get_upper_bounds(attribute):
+        if attribute.UPPER_BOUNDS is None:
+            attribute.UPPER_BOUNDS = [float(v.split("..")[1]) for v in attribute.POSSIBLE_VALUES]
+        return attribute.UPPER_BOUNDS
+
+    @staticmethod
+    def find_bin_code(x, attribute):
+        """This function returns the index of the first bin whose upper bound is not less than x,
+        or x itself if there is no such bin."""
+        k = Discretizer.__search(x, attribute)
+        return x if k == -1 else k
+
+    @staticmethod
+    def find_bin(x, attribute):
+        k = Discretizer.__search(x, attribute)
+        return x if k == -1 else attribute.POSSIBLE_VALUES[k]
+
+    @staticmethod
+    def __search(x, attribute):
+        upper_bounds = attribute.UPPER_BOUNDS
+        if upper_bounds is None:
+            upper_bounds = Discretizer.get_upper_bounds(attribute)
+        k = bisect.bisect_left(upper_bounds, x)
+        # THE SECOND CONDITION HOLDS FOR NAN
+        if k == len(upper_bounds) or not x <= upper_bounds[k]:
+            return -1
+        return k
+
+    @staticmethod
+    def find_bins_codes(column, attribute):
+        """This function bins a whole column of values at once. It returns an int64 array of bin codes,
+        in which -1 stands for the values that are greater than all the upper bounds, or NaN."""
+        upper_bounds = numpy.array(Discretizer.get_upper_bounds(attribute), dtype=numpy.float64)
+        column = numpy.asarray(column, dtype=numpy.float64)
+        codes = numpy.searchsorted(upper_bounds, column, side='left').astype(numpy.int64)
+        codes[(codes == len(upper_bounds)) | numpy.isnan(column)] = -1
+        return codes
+
+    @staticmethod
+    def find_bins(column, attribute):
+        """This function bins a whole column of values at once, as find_bin() does for each value."""
+        codes = Discretizer.find_bins_codes(column, attribute).tolist()
+        values = column.tolist() if isinstance(column, numpy.ndarray) else list(column)
+        bins = attribute.POSSIBLE_VALUES
+        return [values[i] if codes[i] == -1 else bins[codes[i]] for i in range(0, len(codes))]
+
+
+class TransformationPlan:
+    """This class compiles, once, how the records are transformed for a learner category, i.e. discretized for
+    nominal learners, or mapped to numbers and normalized for numeric learners, into a list of (index, function)
+    steps. Dense, sparse, and encoded records are then transformed without checking the types of attributes
+    again. If encoded_records is False, encoded records are decoded while they are transformed.
+    A transformed record is shared by all the learners of the same plan, so learners must not modify it."""
+
+    def __init__(self, labels, attributes, attributes_scheme, learner_category, encoded_records=False):
+        self.LABELS = labels
+        self.ATTRIBUTES = attributes
+        self.LEARNER_CATEGORY = learner_category
+        self.ENCODED_RECORDS = encoded_records
+        self.NUMERIC_ATTRIBUTE_SCHEME = attributes_scheme['numeric']
+        self.NOMINAL_ATTRIBUTE_SCHEME = attributes_scheme['nominal']
+
+        self.STEPS = []
+        self.ENCODED_STEPS = []
+        self.SPARSE_DEFAULTS = []
+        self.SPARSE_FUNCTIONS = []
+        self.compile()
+
+    def compile(self):
+        """This function compiles the steps from the current bounds of the schemes. It is called again whenever
+        an online scheme changes the bounds."""
+        self.STEPS = []
+        self.ENCODED_STEPS = []
+        for k in range(0, len(self.ATTRIBUTES)):
+            function = self.__compile_function(k, False)
+            if function is not None:
+                self.STEPS.append((k, function))
+            function = self.__compile_function(k, True)
+            if function is not None:
+                self.ENCODED_STEPS.append((k, function))
+        if self.ENCODED_RECORDS is False:
+            self.ENCODED_STEPS.append((len(self.ATTRIBUTES), self.LABELS.__getitem__))
+
+        # THE TRANSFORMED DEFAULTS ARE SHARED BY ALL THE TRANSFORMED SPARSE RECORDS
+        functions = dict(self.STEPS)
+        self.SPARSE_DEFAULTS = SparseRecord.get_default_values(self.ATTRIBUTES)
+        for k, function in functions.items():
+            self.SPARSE_DEFAULTS[k] = function(self.SPARSE_DEFAULTS[k])
+        self.SPARSE_FUNCTIONS = [functions.get(k) for k in range(0, len(self.ATTRIBUTES))]
+
+    def __compile_function(self, k, encoded):
+        attribute_type = self.ATTRIBUTES[k].TYPE
+        if self.LEARNER_CATEGORY == TornadoDic.NOM_CLASSIFIER:
+            scheme = self.NOMINAL_ATTRIBUTE_SCHEME[k]
+            if attribute_type == TornadoDic.NUMERIC_ATTRIBUTE:
+                if encoded is True and self.ENCODED_RECORDS is True:
+                    return lambda x: Discretizer.find_bin_code(x, scheme)
+                return lambda x: Discretizer.find_bin(x, scheme)
+            if encoded is True and self.ENCODED_RECORDS is False:
+                return scheme.POSSIBLE_VALUES.__getitem__
+            return None
+        elif self.LEARNER_CATEGORY == TornadoDic.NUM_CLASSIFIER:
+            scheme = self.NUMERIC_ATTRIBUTE_SCHEME[k]
+            min_value = scheme.MINIMUM_VALUE
+            value_range = scheme.MAXIMUM_VALUE - scheme.MINIMUM_VALUE
+            # AN ATTRIBUTE HOLDING ONE VALUE ONLY, E.G. ZERO IN A SPARSE STREAM, IS NORMALIZED TO ZERO
+            if value_range == 0:
+                return lambda x: 0.0
+            if attribute_type == TornadoDic.NOMINAL_ATTRIBUTE:
+                if encoded is True:
+                    return lambda x: (NominalToNumericTransformer.map_attribute_code(x, scheme) - min_value) / value_range
+                return lambda x: (NominalToNumericTransformer.map_attribute_value(x, scheme) - min_value) / value_range
+            return lambda x: (x - min_value) / value_range
+        return None
+
+    def transform(self, record):
+        if isinstance(record, SparseRecord):
+            values = {}
+            for index, value in record.VALUES.items():
+                function = self.SPARSE_FUNCTIONS[index]
+                values[index] = value if function is None else function(value)
+            return SparseRecord(values, self.SPARSE_DEFAULTS, record.LABEL)
+        if isinstance(record, EncodedRecord):
+            r = EncodedRecord(record) if self.ENCODED_RECORDS is True else list(record)
+            steps = self.ENCODED_STEPS
+        else:
+            r = list(record)
+            steps = self.STEPS
+        for k, function in steps:
+            r[k] = function(r[k])
+        return r
+
+    def __getstate__(self):
+        # THE COMPILED STEPS ARE CLOSURES, WHICH CANNOT BE PICKLED, SO THEY ARE COMPILED AGAIN ONCE UNPICKLED
+        state = self.__dict__.copy()
+        state['STEPS'] = []
+        state['ENCODED_STEPS'] = []
+        state['SPARSE_FUNCTIONS'] = []
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.compile()